@@ -16,8 +16,8 @@ Usage:
 """
 
 import argparse
+import itertools
 import json
-import re
 import sys
 from pathlib import Path
 
@@ -28,12 +28,64 @@ except ImportError:
     print("Error: psycopg2-binary not installed. Run: poetry install")
     sys.exit(1)
 
+# (suffix, suffix length, article) triples, built once at import; a plain
+# str.endswith check, no regex needed. "The" first as the most common article.
+# Case-sensitive: catalogued titles always capitalize the moved article.
+SUFFIX_TABLE = tuple((f", {article}", len(article) + 2, article) for article in ("The", "An", "A"))
+
+# All suffixes at once: str.endswith(tuple) rejects a title in one C call
+# however many articles are listed
+SUFFIX_STRINGS = tuple(suffix for suffix, _, _ in SUFFIX_TABLE)
+
+
+def match_article(title):
+    """
+    Find a trailing ", Article" in a title.
+
+    Returns:
+        tuple or None: The matching (suffix, suffix_len, article) SUFFIX_TABLE entry
+    """
+    if not title or not title.endswith(SUFFIX_STRINGS):
+        return None
+    for entry in SUFFIX_TABLE:
+        if title.endswith(entry[0]):
+            return entry
+    return None
+
+
+def move_article(title, match):
+    """
+    Move a matched trailing article to the front of a title.
+
+    Args:
+        title: Original title
+        match: SUFFIX_TABLE entry as returned by match_article
+
+    Returns:
+        str: Fixed title
+    """
+    _, suffix_len, article = match
+
+    # Everything before the ", Article" suffix
+    title_without_article = title[:-suffix_len].strip()
+
+    # Add article to the front
+    return f"{article} {title_without_article}"
+
 
 class TitleFixer:
     """Fix book titles by moving articles from end to beginning."""
 
-    # Articles to look for at the end of titles
-    ARTICLES = ['The', 'A', 'An']
+    # Server-side filter: the suffixes as prefix patterns on reverse(Title),
+    # which can use idx_books_title_rev (database/add_title_suffix_index.sql)
+    REVERSED_SUFFIX_PATTERNS = [f"{suffix[::-1]}%" for suffix in SUFFIX_STRINGS]
+    REVERSED_SUFFIX_WHERE = " OR ".join(["reverse(Title) LIKE %s"] * len(SUFFIX_STRINGS))
+
+    # Rows fetched per round trip by the server-side scan cursor
+    SCAN_BATCH_SIZE = 2000
+
+    # Fixed titles written per bulk UPDATE statement
+    UPDATE_PAGE_SIZE = 500
 
     def __init__(self, config_path, dry_run=False, verbose=False, limit=None):
         """
@@ -96,116 +148,123 @@ class TitleFixer:
         """Close database connection."""
         if self.connection:
             self.connection.close()
+            self.connection = None
             print("\nDisconnected from database")
 
-    def needs_fixing(self, title):
+    def get_books_to_fix(self):
         """
-        Check if a title needs fixing.
+        Query database for books that need fixing.
+
+        The article match runs in the database so only candidate rows are
+        returned; each one is re-checked once here and its fixed title built
+        from that same match.
 
         Returns:
-            tuple: (needs_fixing: bool, article: str or None)
+            list: List of (book, fixed_title) tuples, book a dict with BookId and Title
         """
-        if not title:
-            return False, None
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute("SELECT COUNT(*) AS total FROM books")
+                self.stats['total_scanned'] = cursor.fetchone()['total']
+
+            # Named (server-side) cursor: rows stream in batches of itersize
+            # instead of being materialized client-side with fetchall()
+            with self.connection.cursor(name='title_scan') as cursor:
+                cursor.itersize = self.SCAN_BATCH_SIZE
+                sql = f"""
+                    SELECT BookId AS "BookId", Title AS "Title"
+                    FROM books
+                    WHERE {self.REVERSED_SUFFIX_WHERE}
+                    ORDER BY Title
+                """
+                params = list(self.REVERSED_SUFFIX_PATTERNS)
+                if self.limit:
+                    sql += " LIMIT %s"
+                    params.append(self.limit)
+                cursor.execute(sql, params)
 
-        # Check for each article at the end
-        for article in self.ARTICLES:
-            # Pattern: ends with ", Article" (case insensitive at end)
-            pattern = re.compile(rf',\s*{re.escape(article)}$', re.IGNORECASE)
-            if pattern.search(title):
-                return True, article
+                # One fused pass: match, fix and stop at the limit as rows stream in
+                books_to_fix = list(itertools.islice(self._iter_fixes(cursor), self.limit or None))
+                self.stats['needs_fixing'] += len(books_to_fix)
 
-        return False, None
+                return books_to_fix
 
-    def fix_title(self, title):
+        except psycopg2.Error as e:
+            print(f"Error querying database: {e}")
+            return []
+
+    @staticmethod
+    def _iter_fixes(rows):
         """
-        Fix a title by moving the article to the front.
+        Yield (book, fixed_title) for each row whose title needs fixing.
 
         Args:
-            title: Original title
+            rows: Iterable of book dicts with BookId and Title
 
-        Returns:
-            str: Fixed title, or None if no fix needed
+        Yields:
+            tuple: (book, fixed_title)
         """
-        needs_fix, article = self.needs_fixing(title)
-
-        if not needs_fix:
-            return None
-
-        # Remove the article and comma from the end
-        pattern = re.compile(rf',\s*{re.escape(article)}$', re.IGNORECASE)
-        title_without_article = pattern.sub('', title).strip()
-
-        # Add article to the front
-        fixed_title = f"{article} {title_without_article}"
+        for book in rows:
+            match = match_article(book['Title'])
+            if match:
+                yield book, move_article(book['Title'], match)
 
-        return fixed_title
-
-    def get_books_to_fix(self):
+    def get_authors(self, book_ids):
         """
-        Query database for books that need fixing.
+        Look up authors for a set of books (only needed for verbose output).
+
+        Args:
+            book_ids: List of BookIds
 
         Returns:
-            list: List of dict with BookId and Title
+            dict: Author keyed by BookId
         """
+        if not book_ids:
+            return {}
         try:
             with self.connection.cursor() as cursor:
-                sql = """
-                    SELECT BookId, Title, Author
-                    FROM books
-                    ORDER BY Title
-                """
-                cursor.execute(sql)
-                all_books = cursor.fetchall()
-
-                # Filter books that need fixing
-                books_to_fix = []
-                for book in all_books:
-                    self.stats['total_scanned'] += 1
-
-                    if self.needs_fixing(book['Title'])[0]:
-                        books_to_fix.append(book)
-                        self.stats['needs_fixing'] += 1
-
-                        # Apply limit if specified
-                        if self.limit and len(books_to_fix) >= self.limit:
-                            break
-
-                return books_to_fix
+                cursor.execute(
+                    'SELECT BookId AS "BookId", Author AS "Author" FROM books WHERE BookId = ANY (%s)',
+                    (list(book_ids),)
+                )
+                return {row['BookId']: row['Author'] for row in cursor.fetchall()}
 
         except psycopg2.Error as e:
-            print(f"Error querying database: {e}")
-            return []
+            print(f"Error querying authors: {e}")
+            return {}
 
-    def update_title(self, book_id, new_title):
+    def update_titles(self, updates):
         """
-        Update a book's title in the database.
+        Update book titles in the database in a single transaction.
 
         Args:
-            book_id: BookId
-            new_title: New title to set
+            updates: List of (new_title, book_id) tuples
 
         Returns:
-            bool: True if successful, False otherwise
+            int: Number of titles updated (0 on failure)
         """
         if self.dry_run:
-            return True  # Pretend success in dry-run mode
+            return len(updates)  # Pretend success in dry-run mode
 
         try:
             with self.connection.cursor() as cursor:
+                # One UPDATE ... FROM (VALUES ...) joins up to UPDATE_PAGE_SIZE
+                # fixed titles per statement instead of one UPDATE per book
                 sql = """
                     UPDATE books
-                    SET Title = %s
-                    WHERE BookId = %s
+                    SET Title = v.Title
+                    FROM (VALUES %s) AS v (Title, BookId)
+                    WHERE books.BookId = v.BookId
                 """
-                cursor.execute(sql, (new_title, book_id))
-                self.connection.commit()
-                return True
+                psycopg2.extras.execute_values(cursor, sql, updates, page_size=self.UPDATE_PAGE_SIZE)
+            self.connection.commit()
+            return len(updates)
 
         except psycopg2.Error as e:
-            print(f"Error updating book {book_id}: {e}")
-            self.stats['errors'] += 1
-            return False
+            self.connection.rollback()
+            print(f"Error updating {len(updates)} titles: {e}")
+            self.stats['errors'] += len(updates)
+            return 0
 
     def fix_all_titles(self):
         """Main function to fix all titles that need fixing."""
@@ -237,26 +296,35 @@ class TitleFixer:
         print("CHANGES:")
         print("=" * 80 + "\n")
 
-        for book in books_to_fix:
+        # Author is only shown in verbose mode, so fetch it just for the matches
+        authors = self.get_authors([book['BookId'] for book, _ in books_to_fix]) if self.verbose else {}
+
+        updates = []
+        # Non-verbose change lines are written in one go after the loop
+        output_lines = []
+        for book, new_title in books_to_fix:
             book_id = book['BookId']
             old_title = book['Title']
-            author = book['Author']
-            new_title = self.fix_title(old_title)
-
-            if new_title:
-                # Show the change
-                if self.verbose:
-                    print(f"ID: {book_id}")
-                    print(f"Author: {author}")
-                    print(f"  OLD: {old_title}")
-                    print(f"  NEW: {new_title}")
-                    print()
-                else:
-                    print(f"{old_title:60s} -> {new_title}")
-
-                # Update in database
-                if self.update_title(book_id, new_title):
-                    self.stats['fixed'] += 1
+            author = authors.get(book_id)
+
+            # Show the change
+            if self.verbose:
+                print(f"ID: {book_id}")
+                print(f"Author: {author}")
+                print(f"  OLD: {old_title}")
+                print(f"  NEW: {new_title}")
+                print()
+            else:
+                output_lines.append(f"{old_title:60s} -> {new_title}")
+
+            updates.append((new_title, book_id))
+
+        if output_lines:
+            sys.stdout.write("\n".join(output_lines) + "\n")
+            sys.stdout.flush()
+
+        # Update in database, one commit for the whole batch
+        self.stats['fixed'] += self.update_titles(updates)
 
         # Print summary
         print("\n" + "=" * 80)
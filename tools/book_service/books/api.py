@@ -1,16 +1,27 @@
 __version__ = '0.20.0'
 
+import concurrent.futures
 import functools
-import json
+import glob
+import hashlib
+import hmac
+import itertools
 import os
-from io import BytesIO
+import shutil
+import tempfile
+import time
+from io import BytesIO, UnsupportedOperation
 from logging.config import dictConfig
 
+import orjson
 import pandas as pd
+import psycopg2.extras
 import requests
+from requests.adapters import HTTPAdapter
 from booksdb.api_util import *
-from flask import Flask, Response, send_file, request, abort
-from matplotlib import pylab as plt
+from flask import Flask, Response, send_file, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
 from werkzeug.utils import secure_filename
 
 from books.isbn_com import Endpoint as isbn
@@ -30,15 +41,97 @@ dictConfig({
     }
 })
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that parses request bodies with orjson."""
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16 MB upload limit
 
+# Static header shared by every JSON response
+CONTENT_TYPE_JSON = ('Content-type', 'application/json; charset=utf-8')
+
+# Encoded once for the constant-time key comparison in require_app_key
+API_KEY_BYTES = API_KEY.encode('utf-8')
+
+# Body and headers for a missing or wrong key, returned without raising
+# through abort(); each request gets its own Response built from them
+UNAUTHORIZED_BODY = b'{"error":"unauthorized"}'
+UNAUTHORIZED_HEADERS = (CONTENT_TYPE_JSON, ('Content-Length', str(len(UNAUTHORIZED_BODY))))
+
+# Static SQL for the write and lookup endpoints, built once at import
+SQL_INSERT_BOOKS = ("INSERT INTO books "
+                    "(Title, Author, CopyrightDate, IsbnNumber, IsbnNumber13, PublisherName, CoverType, Pages, "
+                    "Location, BookNote, Recycled) "
+                    "VALUES %s RETURNING bookid")
+SQL_INSERT_READ_DATES = "INSERT INTO books_read (BookId, ReadDate, ReadNote) VALUES %s"
+SQL_UPDATE_READ_NOTE = "UPDATE books_read SET ReadNote=%s WHERE BookId = %s AND ReadDate = %s"
+SQL_UPDATE_TAG_LABEL = "UPDATE tag_labels SET Label = %s WHERE Label = %s"
+SQL_NORMALIZE_TAG_LABELS = "UPDATE tag_labels SET Label = TRIM(LOWER(Label))"
+SQL_RECORD_SET = ("SELECT StartDate, RecordId FROM complete_date_estimates "
+                  "WHERE BookId = %s ORDER BY StartDate ASC")
+SQL_INSERT_DATE_PAGE = "INSERT INTO daily_page_records (RecordId, RecordDate, Page) VALUES (%s, %s, %s)"
+SQL_INSERT_DATE_PAGES = "INSERT INTO daily_page_records (RecordId, RecordDate, Page) VALUES %s"
+SQL_INSERT_BOOK_ESTIMATE = ("INSERT INTO complete_date_estimates (BookId, StartDate, LastReadablePage) "
+                            "VALUES (%s, %s, %s)")
+SQL_INSERT_IMAGE = ("INSERT INTO images "
+                    "(BookId, Name, Url, ImageType) "
+                    "VALUES (%s, %s, %s, %s) RETURNING imageid")
+
+# Keep-alive session for add_image URL checks; (connect, read) timeouts in seconds
+IMAGE_CHECK_TIMEOUT = (2, 3)
+image_check_session = requests.Session()
+image_check_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+image_check_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+image_check_session.max_redirects = 2
+# Largest image add_image will link to, by the Content-Length the host reports
+MAX_IMAGE_URL_BYTES = 64 * 1024 * 1024
+
+# Where uploaded images are stored, and the copy size for streamed uploads
+UPLOAD_IMAGE_PATH = '/books/uploads'
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+# Concurrent add_date_page calls share one multi-row INSERT
+date_page_batcher = InsertBatcher(SQL_INSERT_DATE_PAGES, SQL_INSERT_DATE_PAGE)
+
+# Responses with more rows than this are streamed; rows are encoded in chunks of STREAM_CHUNK_ROWS
+STREAM_MIN_ROWS = 100
+STREAM_CHUNK_ROWS = 100
+
+# matplotlib's default resolution, kept so charts keep their size and sharpness
+CHART_DPI = 100
+# Rendered charts, one file per chart and data version; served by path so
+# uWSGI can send them with sendfile()
+CHART_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'book_charts')
+
+# Cache lifetimes (seconds) for rarely changing responses
+CONFIGURATION_CACHE_SECONDS = 60
+VALID_LOCATIONS_CACHE_SECONDS = 300
+
+# Complete records for a window are fetched concurrently to overlap DB round trips
+record_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+# ISBN lookups are remote HTTP calls; run them concurrently as well
+isbn_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+# Appended to a year-only CopyrightDate to make it a valid timestamp
+COPYRIGHT_YEAR_SUFFIX = "-01-01 00:00:00"
+# Payloads with at least this many books parse their dates in one pandas call
+BULK_DATE_PARSE_MIN_RECORDS = 50
+
+# update_book_note_status needs BookId plus at least one of these fields
+NOTE_STATUS_FIELDS = frozenset({"BookNote", "Recycled"})
+
 
 def resp_header(rdata):
     """
     Generate HTTP response headers for a JSON payload.
 
-    This function constructs a list of header tuples suitable for sending an HTTP
+    This function constructs a tuple of header pairs suitable for sending an HTTP
     response containing JSON data.  It automatically sets the `Content-Type`
     to JSON with UTF‑8 encoding and calculates the correct `Content-Length`
     based on the supplied response body.
@@ -50,17 +143,15 @@ def resp_header(rdata):
             payload.
 
     Returns:
-        list[tuple[str, str]]: A list of two‑item tuples where each tuple
-            contains a header name and its corresponding value.  The list
+        tuple[tuple[str, str], ...]: Two‑item tuples where each tuple
+            contains a header name and its corresponding value.  The result
             always contains the `Content-Type` header for JSON with UTF‑8
             encoding followed by the `Content-Length` header reflecting
-            the byte length of `rdata`.
+            the byte length of `rdata`.  A `str` body is measured by its
+            UTF‑8 encoding, so non-ASCII payloads get the correct length.
     """
-    response_header = [
-        ('Content-type', 'application/json; charset=utf-8'),
-        ('Content-Length', str(len(rdata)))
-    ]
-    return response_header
+    content_length = len(rdata.encode('utf-8')) if isinstance(rdata, str) else len(rdata)
+    return CONTENT_TYPE_JSON, ('Content-Length', str(content_length))
 
 
 def require_app_key(view_function):
@@ -78,28 +169,22 @@ def require_app_key(view_function):
     -------
     callable
         A new function that first checks the request header 'x-api-key' against
-        the configured API_KEY. If the key matches, it forwards the call to
-        view_function; otherwise it logs an error and aborts with a 401
-        Unauthorized response.
-
-    Raises
-    ------
-    HTTPException
-        Raised when the 'x-api-key' header is missing or does not match
-        the expected API_KEY. The abort(401) call from Flask triggers this
-        exception, causing an HTTP 401 Unauthorized error to be returned.
+        the configured API_KEY in constant time. If the key matches, it forwards the call to
+        view_function; otherwise it logs an error and returns the prebuilt
+        401 Unauthorized JSON response.
     """
 
     @functools.wraps(view_function)
     # the new, post-decoration function. Note *args and **kwargs here.
     def decorated_function(*args, **kwargs):
         # Select one of these:
-        # if request.args.get('key') and request.args.get('key') == key:
-        if request.headers.get('x-api-key') and request.headers.get('x-api-key') == API_KEY:
+        # key = request.args.get('key')
+        key = request.headers.get('x-api-key')
+        if key and hmac.compare_digest(key.encode('utf-8'), API_KEY_BYTES):
             return view_function(*args, **kwargs)
         else:
             app_logger.error("x-api-key missing or incorrect.")
-            abort(401)
+            return Response(UNAUTHORIZED_BODY, status=401, headers=list(UNAUTHORIZED_HEADERS))
 
     return decorated_function
 
@@ -121,11 +206,12 @@ def json_response(data, status=200):
         A Flask Response object with JSON content and headers.
     """
     try:
-        rdata = json.dumps(data)
+        # orjson returns UTF-8 bytes, so Content-Length is the exact body size
+        rdata = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
         return Response(response=rdata, status=status, headers=resp_header(rdata))
     except (TypeError, ValueError) as e:
         app.logger.error(f"JSON serialization error: {e}")
-        error_data = json.dumps({"error": "Failed to serialize response data", "details": str(e)})
+        error_data = orjson.dumps({"error": "Failed to serialize response data", "details": str(e)})
         return Response(response=error_data, status=500, headers=resp_header(error_data))
 
 
@@ -145,12 +231,125 @@ def json_string_response(json_str, status=200):
     Response
         A Flask Response object with JSON content and headers.
     """
-    return Response(response=json_str, status=status, headers=resp_header(json_str))
+    # Encode once; the same bytes are measured for Content-Length and sent as the body
+    rdata = json_str.encode('utf-8') if isinstance(json_str, str) else json_str
+    return Response(response=rdata, status=status, headers=resp_header(rdata))
+
+
+# Empty 204 that browsers cache instead of re-requesting
+FAVICON_HEADERS = (("Cache-Control", "public, max-age=31536000, immutable"),)
+
+
+def json_stream_response(rows, prefix=b"[", suffix=b"]", status=200):
+    """
+    Create a streaming Flask Response that encodes a JSON array as it is sent.
+
+    Parameters
+    ----------
+    rows : iterable
+        JSON-serializable array elements, consumed lazily.
+    prefix : bytes, optional
+        Bytes written before the first element (default: ``b"["``).
+    suffix : bytes, optional
+        Bytes written after the last element (default: ``b"]"``).
+    status : int, optional
+        The HTTP status code (default: 200).
+
+    Returns
+    -------
+    Response
+        A Flask Response with a chunked body; there is no Content-Length
+        because the size is not known until the last row is encoded.
+    """
+    def generate():
+        yield prefix
+        row_iter = iter(rows)
+        separator = b""
+        while chunk := list(itertools.islice(row_iter, STREAM_CHUNK_ROWS)):
+            yield separator + b",".join(
+                orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) for row in chunk)
+            separator = b","
+        yield suffix
+
+    return Response(generate(), status=status, headers=[CONTENT_TYPE_JSON])
+
+
+def normalize_copyright_dates(copyright_dates):
+    """
+    Turn submitted CopyrightDate strings into values the books table accepts.
+
+    A year-only date becomes January 1st of that year.  Large payloads are
+    parsed in one vectorized ``pd.to_datetime`` call; values it cannot parse,
+    such as years before pandas' Timestamp range, get the same year rule and
+    are otherwise passed through for the database to accept or reject.
+
+    Parameters
+    ----------
+    copyright_dates : list[str]
+        CopyrightDate values in payload order.
+
+    Returns
+    -------
+    list[str]
+        Normalized date strings in the same order.
+    """
+    stripped = [d.strip() for d in copyright_dates]
+    if len(stripped) < BULK_DATE_PARSE_MIN_RECORDS:
+        return [_normalize_copyright_date(d) for d in stripped]
+    parsed = pd.to_datetime(pd.Series(stripped), format="ISO8601", errors="coerce")
+    formatted = parsed.dt.strftime("%Y-%m-%d %H:%M:%S").tolist()
+    # values pandas could not parse, including years outside Timestamp bounds,
+    # get the same rule as small payloads
+    return [f if isinstance(f, str) else _normalize_copyright_date(d) for f, d in zip(formatted, stripped)]
+
+
+def _normalize_copyright_date(copyright_date):
+    # a year-only date becomes January 1st of that year
+    return copyright_date + COPYRIGHT_YEAR_SUFFIX if len(copyright_date) == 4 else copyright_date
+
+
+def save_upload(stream, file_path):
+    """
+    Write an uploaded file's stream to file_path.
+
+    When the stream has a file descriptor (an upload spooled to a temporary
+    file), the bytes are copied kernel-side with ``os.copy_file_range``;
+    in-memory uploads, or filesystems that refuse the call, fall back to
+    ``shutil.copyfileobj``.
+
+    Parameters
+    ----------
+    stream : file object
+        The upload's stream, positioned at the start of the data.
+    file_path : str
+        Destination path; an existing file is overwritten.
+    """
+    src_fd = None
+    if hasattr(os, "copy_file_range"):
+        # in-memory streams such as BytesIO have no file descriptor
+        try:
+            src_fd = stream.fileno()
+            stream.flush()
+        except (AttributeError, OSError, UnsupportedOperation):
+            src_fd = None
+
+    with open(file_path, 'wb') as out_file:
+        if src_fd is not None:
+            offset = start = stream.tell()
+            try:
+                while copied := os.copy_file_range(src_fd, out_file.fileno(), UPLOAD_CHUNK_BYTES * 16, offset):
+                    offset += copied
+                return
+            except OSError:
+                if offset != start:
+                    raise
+                # nothing copied yet: use the portable path instead
+        shutil.copyfileobj(stream, out_file, UPLOAD_CHUNK_BYTES * 16)
 
 
 @app.route('/favicon.ico')
 def favicon():
-    return '', 204
+    return Response(b"", status=204, headers=list(FAVICON_HEADERS))
 
 
 @app.route('/configuration')
@@ -167,6 +366,17 @@ def configuration():
         configuration dictionaries, the ISBN configuration, and the current
         date/time in ISO 8601 format.
     """
+    return json_string_response(_configuration_body(int(time.time()) // CONFIGURATION_CACHE_SECONDS))
+
+
+@functools.lru_cache(maxsize=1)
+def _configuration_body(time_bucket):
+    """
+    Serialized /configuration body, rebuilt once per time bucket.
+
+    The date is reported to the minute, so reusing the body within one
+    bucket only repeats what a fresh build would say.
+    """
     books_conf_clean = books_conf.copy()
     books_conf_clean["password"] = "******"
     isbn_conf_clean = isbn_conf.copy()
@@ -177,7 +387,7 @@ def configuration():
         "isbn_configuration": isbn_conf_clean,
         "date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M")
     }
-    return json_response(clean)
+    return orjson.dumps(clean)
 
 
 ##########################################################################
@@ -206,11 +416,25 @@ def valid_locations():
         A Flask Response object containing the serialized valid locations
         data and the appropriate HTTP headers.
     """
-    rdata, s, header, errors = get_valid_locations()
-    result = serialized_result_dict(rdata, header, errors)
+    result, ok = _valid_locations_body(int(time.time()) // VALID_LOCATIONS_CACHE_SECONDS)
+    if not ok:
+        # never serve a cached error
+        _valid_locations_body.cache_clear()
     return json_string_response(result)
 
 
+@functools.lru_cache(maxsize=1)
+def _valid_locations_body(time_bucket):
+    """
+    Serialized /valid_locations body and whether the query succeeded.
+
+    Cached per time bucket; endpoints that can add or change a book's
+    Location clear the cache so this worker serves the new list at once.
+    """
+    rdata, s, header, errors = get_valid_locations()
+    return serialized_result_dict(rdata, header, errors), errors is None
+
+
 ##########################################################################
 # BOOKS WITH MOST RECENT UPDATES
 ##########################################################################
@@ -274,41 +498,39 @@ def add_books():
     :return:
     """
     # records should be a list of dictionaries including all fields
-    db = psycopg2.connect(**books_conf)
     records = request.get_json()
-    search_str = ("INSERT INTO books "
-                  "(Title, Author, CopyrightDate, IsbnNumber, IsbnNumber13, PublisherName, CoverType, Pages, "
-                  "Location, BookNote, Recycled) "
-                  "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING bookid")
+    copyright_dates = normalize_copyright_dates([record["CopyrightDate"] for record in records])
+    params = [(
+        record["Title"],
+        record["Author"],
+        copyright_date,
+        record["IsbnNumber"],
+        record["IsbnNumber13"],
+        record["PublisherName"],
+        record["CoverType"],
+        record["Pages"],
+        record["Location"],
+        record["BookNote"],
+        record["Recycled"]
+    ) for record, copyright_date in zip(records, copyright_dates)]
+    db = get_db_connection()
     rdata = []
     try:
         with db.cursor() as c:
-            for record in records:
-                try:
-                    copyright_date = record["CopyrightDate"]
-                    if len(copyright_date.strip()) == 4:
-                        copyright_date += "-01-01 00:00:00"  # make it a valid date string!
-                    c.execute(search_str, (
-                        record["Title"],
-                        record["Author"],
-                        copyright_date,
-                        record["IsbnNumber"],
-                        record["IsbnNumber13"],
-                        record["PublisherName"],
-                        record["CoverType"],
-                        record["Pages"],
-                        record["Location"],
-                        record["BookNote"],
-                        record["Recycled"]
-                    ))
-                    record["BookId"] = c.fetchone()[0]
-                    rdata.append(record)
-                except psycopg2.Error as e:
-                    app.logger.error(e)
-                    rdata.append({"error": str(e)})
+            try:
+                # One multi-row INSERT; RETURNING yields the new ids in VALUES order
+                book_ids = psycopg2.extras.execute_values(c, SQL_INSERT_BOOKS, params, fetch=True)
+                for record, (book_id,) in zip(records, book_ids):
+                    record["BookId"] = book_id
+                rdata = records
+            except psycopg2.Error as e:
+                # the batch is one transaction, so no record was added
+                app.logger.error(e)
+                rdata = [{"error": str(e)} for _ in records]
         db.commit()
     finally:
-        db.close()
+        release_db_connection(db)
+    _valid_locations_body.cache_clear()
     return json_response({"add_books": rdata})
 
 
@@ -330,27 +552,22 @@ def add_read_dates():
     :return:
     """
     # records should be a list of dictionaries including all fields
-    db = psycopg2.connect(**books_conf)
     records = request.get_json()
-    search_str = 'INSERT INTO books_read (BookId, ReadDate, ReadNote) VALUES (%s, %s, %s)'
+    params = [(record["BookId"], record["ReadDate"], record["ReadNote"]) for record in records]
     res = {"update_read_dates": [], "error": []}
+    db = get_db_connection()
     try:
         with db.cursor() as c:
-            for record in records:
-                try:
-                    app.logger.debug(f"Inserting read date for BookId: {record['BookId']}")
-                    c.execute(search_str, (
-                        record["BookId"],
-                        record["ReadDate"],
-                        record["ReadNote"]
-                    ))
-                    res["update_read_dates"].append(record)
-                except psycopg2.Error as e:
-                    app.logger.error(e)
-                    res["error"].append(str(e))
+            try:
+                app.logger.debug(f"Inserting {len(params)} read dates")
+                psycopg2.extras.execute_values(c, SQL_INSERT_READ_DATES, params)
+                res["update_read_dates"] = records
+            except psycopg2.Error as e:
+                app.logger.error(e)
+                res["error"].append(str(e))
         db.commit()
     finally:
-        db.close()
+        release_db_connection(db)
     return json_response(res)
 
 
@@ -371,8 +588,7 @@ def books_by_isbn():
     book_isbn_list = request.get_json()["isbn_list"]
     res = []
     a = isbn(isbn_conf)
-    for book_isbn in book_isbn_list:
-        res_json = a.get_book_by_isbn(book_isbn)
+    for book_isbn, res_json in zip(book_isbn_list, isbn_pool.map(a.get_book_by_isbn, book_isbn_list)):
         if res_json is not None:
             proto = a._endpoint_to_collection_db(res_json)
             res.append(proto)
@@ -402,15 +618,14 @@ def update_edit_read_note():
     :return:
     """
     # records should be a single dictionaries including all fields
-    db = psycopg2.connect(**books_conf)
     record = request.get_json()
-    search_str = "UPDATE books_read SET ReadNote=%s WHERE BookId = %s AND ReadDate = %s"
     app.logger.debug(f"Updating read note for BookId: {record['BookId']}")
+    db = get_db_connection()
     rdata = []
     try:
         with db.cursor() as c:
             try:
-                c.execute(search_str, (
+                c.execute(SQL_UPDATE_READ_NOTE, (
                     record["ReadNote"],
                     record["BookId"],
                     record["ReadDate"]
@@ -421,17 +636,17 @@ def update_edit_read_note():
                 rdata.append({"error": str(e)})
         db.commit()
     finally:
-        db.close()
+        release_db_connection(db)
     if record.get("ReadNote") and record["ReadNote"].strip():
         embed_db = None
         try:
-            embed_db = psycopg2.connect(**books_conf)
+            embed_db = get_db_connection()
             upsert_read_note_embedding(embed_db, record["BookId"], record["ReadDate"], record["ReadNote"].strip())
         except Exception as e:
             app.logger.error(f"read_note embed update failed: {e}")
         finally:
             if embed_db:
-                embed_db.close()
+                release_db_connection(embed_db)
     return json_response({"update_read": rdata})
 
 
@@ -455,20 +670,20 @@ def update_book_note_status():
     # records should be a single dictionaries including all changed fields
     record = request.get_json()
     # test of the record has BookId and one or both of BookNote and Recycled fields
-    if not ("BookId" in record and ("BookNote" in record or "Recycled" in record)):
+    if "BookId" not in record or record.keys().isdisjoint(NOTE_STATUS_FIELDS):
         return json_response({"error": "Missing required fields: BookId, BookNote OR Recycled"}, status=400)
     else:
         data = update_book_record_by_key(record)
         if record.get("BookNote") and record["BookNote"].strip():
             embed_db = None
             try:
-                embed_db = psycopg2.connect(**books_conf)
+                embed_db = get_db_connection()
                 upsert_book_note_embedding(embed_db, record["BookId"], record["BookNote"].strip())
             except Exception as e:
                 app.logger.error(f"book_note embed update failed for BookId={record['BookId']}: {e}")
             finally:
                 if embed_db:
-                    embed_db.close()
+                    release_db_connection(embed_db)
         return json_response({"update_read": data})
 
 
@@ -481,6 +696,8 @@ def update_book_record():
       "BookId": 1606,
       "Recycled": 0
     }
+    or a list of such records, updated together with one UPDATE per set of
+    changed columns.
 
     E.g.
     curl -X POST -H "Content-type: application/json" -d @./example_json_payloads/test_update_book_note_status.json \
@@ -488,13 +705,16 @@ def update_book_record():
 
     :return:
     """
-    # records should be a single dictionaries including all changed fields
-    record = request.get_json()
-    # test of the record has BookId and one of any other field
-    if not ("BookId" in record and len(record.keys()) > 1):
+    # a single dictionary including all changed fields, or a list of them
+    payload = request.get_json()
+    records = payload if isinstance(payload, list) else [payload]
+    # test each record has BookId and one of any other field
+    if not records or any("BookId" not in record or len(record) < 2 for record in records):
         return json_response({"error": "Missing required fields: BookId, and any other field"}, status=400)
     else:
-        data = update_book_record_by_key(record)
+        data = update_book_records_bulk(records)
+        if any("Location" in record for record in records):
+            _valid_locations_body.cache_clear()
         return json_response({"update_read": data})
 
 
@@ -551,11 +771,38 @@ def books_read(target_year=None):
         headers.
     :rtype: Response
     """
+    if target_year is None:
+        return books_read_stream()
     rdata, _, header, error_list = books_read_by_year_utility(target_year)
     result = serialized_result_dict(rdata, header, error_list)
     return json_string_response(result)
 
 
+def books_read_stream():
+    """
+    Stream every book read, fetching rows from the database as they are sent.
+
+    The row generator is started before the response is built, so a query
+    error still gets the ordinary books_read body, and it is closed with the
+    response, so its pooled connection is released even if the client goes
+    away before the body is sent.
+    """
+    rows = iter_books_read_by_year(chunk_size=10 * STREAM_CHUNK_ROWS)
+    try:
+        first_row = next(rows)
+    except StopIteration:
+        return json_string_response(serialized_result_dict([], books_read_header))
+    except psycopg2.Error as e:
+        app.logger.error(e)
+        return json_string_response(serialized_result_dict(None, books_read_header, [str(e)]))
+    # same body as serialized_result_dict, with rows converted as they stream
+    prefix = b'{"header":' + orjson.dumps(books_read_header) + b',"data":['
+    response = json_stream_response(map(_convert_db_types, itertools.chain([first_row], rows)),
+                                    prefix=prefix, suffix=b"]}")
+    response.call_on_close(rows.close)
+    return response
+
+
 @app.route('/status_read/<book_id>')
 @require_app_key
 def status_read(book_id=None):
@@ -605,7 +852,8 @@ def books_search():
     -----
     The function extracts query arguments from the Flask `request.args` object,
     passes them to the `books_search_utility` helper, and then serializes
-    the resulting data with `serialized_result_dict`.
+    the resulting data with `serialized_result_dict`, or streams it with
+    `json_stream_response` when there are more than STREAM_MIN_ROWS rows.
     The `resp_header` function is used to construct the appropriate HTTP
     headers for the response.
 
@@ -613,6 +861,10 @@ def books_search():
     # process any query parameters
     args = request.args
     rdata, header, error_list = books_search_utility(args)
+    if rdata is not None and len(rdata) > STREAM_MIN_ROWS:
+        # same body as serialized_result_dict, with rows converted as they stream
+        prefix = b'{"header":' + orjson.dumps(header) + b',"data":['
+        return json_stream_response(map(_convert_db_types, rdata), prefix=prefix, suffix=b"]}")
     result = serialized_result_dict(rdata, header, error_list)
     return json_string_response(result)
 
@@ -665,17 +917,15 @@ def complete_record_window(book_id, window=20):
     Notes
     -----
     This route internally uses `get_book_ids_in_window` to obtain the list
-    of book IDs, then retrieves each complete record with
-    `get_complete_book_record`.  The response headers are generated by
+    of book IDs, then retrieves the complete records concurrently with
+    `get_complete_book_record` on `record_pool`.  The response headers are generated by
     `resp_header`.
 
     See Also
     --------
     get_book_ids_in_window, get_complete_book_record, resp_header
     """
-    window_list = []
-    for bid in get_book_ids_in_window(book_id, window):
-        window_list.append(get_complete_book_record(bid))
+    window_list = list(record_pool.map(get_complete_book_record, get_book_ids_in_window(book_id, window)))
     return json_response(window_list)
 
 
@@ -684,7 +934,7 @@ def complete_record_window(book_id, window=20):
 def complete_record_window_by_ids():
     data = request.get_json()
     book_ids = data.get("book_ids", [])
-    results = get_complete_records_by_ids(book_ids)
+    results = list(record_pool.map(get_complete_book_record, book_ids))
     return json_response(results)
 
 @app.route('/complete_record/<book_id>')
@@ -716,9 +966,12 @@ def complete_record(book_id, adjacent=None):
 
     Notes:
         * When `adjacent` is `"next"`, the function obtains the next book ID
-          with `get_next_book_id(book_id, 1)` and retrieves that record.
+          with `get_next_book_id(book_id, 1)` and retrieves that record. Past
+          the last book there is no forward wrap and an empty JSON object is
+          returned.
         * When `adjacent` starts with `"prev"`, it obtains the previous book ID
-          with `get_next_book_id(book_id, -1)` and retrieves that record.
+          with `get_next_book_id(book_id, -1)` and retrieves that record; before
+          the first book it wraps around to the last.
         * Invalid `adjacent` values are logged with `app.logger.error` and result
           in an empty JSON response.
     """
@@ -749,6 +1002,7 @@ def delete_book_endpoint(book_id):
     result = delete_book(book_id)
     if "error" in result:
         return json_response(result, status=404)
+    _valid_locations_body.cache_clear()
     return json_response(result)
 
 
@@ -773,6 +1027,26 @@ def add_tag(book_id, tag):
     return json_response(result_data)
 
 
+@app.route('/add_tags/<book_id>', methods=["PUT"])
+@require_app_key
+def add_tags(book_id):
+    """
+    Add a list of tags to a book with one database statement.
+
+    E.g.
+    curl -X PUT -H "Content-type: application/json" -d '["fiction", "classic"]' \
+    http://172.17.0.2:5000/add_tags/1234
+
+    :return:
+    """
+    # tags should be a list of tag strings
+    tags = request.get_json(silent=True)
+    if not isinstance(tags, list) or not tags or not all(isinstance(tag, str) for tag in tags):
+        return json_response({"error": "Request body must be a non-empty JSON list of tag strings"}, status=400)
+    result_data, error_list = add_tags_to_book(book_id, tags)
+    return json_response({"data": result_data} if error_list is None else result_data)
+
+
 @app.route('/tag_counts')
 @app.route('/tag_counts/<tag>')
 @require_app_key
@@ -849,20 +1123,21 @@ def update_tag_value(current, updated):
     ------
     None
     """
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     result_data = None
     try:
         with db.cursor() as c:
             try:
-                _updated = updated.lower().strip(" ")
-                c.execute("UPDATE tag_labels SET Label = %s WHERE Label = %s", (_updated, current))
+                _updated = updated.strip().lower()
+                c.execute(SQL_UPDATE_TAG_LABEL, (_updated, current))
                 result_data = {"data": {"tag_update": f"{current} >> {updated}", "updated_tags": c.rowcount}}
             except psycopg2.Error as e:
                 app.logger.error(e)
                 result_data = {"error": str(e)}
         db.commit()
+        clear_tag_counts()
     finally:
-        db.close()
+        release_db_connection(db)
     return json_response(result_data)
 
 
@@ -896,18 +1171,19 @@ def tags_search(match_str):
 @app.route('/tag_maintenance')
 @require_app_key
 def tag_maintenance():
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     rdata = {"tag_maintenance": {}}
     try:
         with db.cursor() as c:
             try:
-                c.execute("UPDATE tag_labels SET Label = TRIM(LOWER(Label))")
+                c.execute(SQL_NORMALIZE_TAG_LABELS)
                 db.commit()
+                clear_tag_counts()
             except psycopg2.Error as e:
                 rdata = {"error": [str(e)]}
                 app.logger.error(e)
     finally:
-        db.close()
+        release_db_connection(db)
     return json_response(rdata)
 
 
@@ -923,7 +1199,7 @@ def date_page_records(record_id=None):
     if error_list:
         rdata["error"] = error_list
     elif len(data) > 0:
-        rdata["date_page_records"] = [(x.strftime(FMT), int(y), int(z)) for [x, y, z] in data]
+        rdata["date_page_records"] = [(r[0].strftime(FMT), int(r[1]), int(r[2])) for r in data]
     else:
         rdata["error"] = "No records found."
     return json_response(rdata)
@@ -932,23 +1208,24 @@ def date_page_records(record_id=None):
 @app.route('/record_set/<book_id>')
 @require_app_key
 def record_set(book_id=None):
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     rdata = {"record_set": {"BookId": book_id, "RecordId": [], "Estimate": []}}
-    q = "SELECT StartDate, RecordId FROM complete_date_estimates WHERE BookId = %s ORDER BY StartDate ASC"
     res = []
     try:
         with db.cursor() as c:
             try:
-                c.execute(q, (book_id,))
+                c.execute(SQL_RECORD_SET, (book_id,))
                 res = c.fetchall()
             except psycopg2.Error as e:
                 rdata["error"] = [str(e)]
                 app.logger.error(e)
     finally:
-        db.close()
-    for record in [(str(x[0]), int(x[1])) for x in res]:
-        rdata["record_set"]["RecordId"].append(record)
-        rdata["record_set"]["Estimate"].append(calculate_estimates(record[1]))
+        release_db_connection(db)
+    record_ids = rdata["record_set"]["RecordId"]
+    estimates = rdata["record_set"]["Estimate"]
+    for start_date, record_id in res:
+        record_ids.append((str(start_date), int(record_id)))
+        estimates.append(calculate_estimates(record_id))
     return json_response(rdata)
 
 
@@ -971,25 +1248,19 @@ def add_date_page():
     """
     # records should be a single dictionaries including all fields
     record = request.get_json()
-    search_str = "INSERT INTO daily_page_records (RecordId, RecordDate, Page) VALUES (%s, %s, %s)"
     app.logger.debug(f"Inserting date page record for RecordId: {record.get('RecordId')}")
-    db = psycopg2.connect(**books_conf)
-    result_data = {"error": "No record added."}
+    future = date_page_batcher.submit((
+        record["RecordId"],
+        record["RecordDate"],
+        record["Page"]
+    ))
     try:
-        with db.cursor() as c:
-            try:
-                c.execute(search_str, (
-                    record["RecordId"],
-                    record["RecordDate"],
-                    record["Page"]
-                ))
-                result_data = {"add_date_page": record}
-            except psycopg2.Error as e:
-                app.logger.error(e)
-                result_data = {"add_date_page": {}, "error": str(e)}
-        db.commit()
-    finally:
-        db.close()
+        # wait for the batch holding this row so errors still reach the caller
+        future.result()
+        result_data = {"add_date_page": record}
+    except psycopg2.Error as e:
+        app.logger.error(e)
+        result_data = {"add_date_page": {}, "error": str(e)}
     return json_response(result_data)
 
 
@@ -998,16 +1269,15 @@ def add_date_page():
 @require_app_key
 def add_book_estimate(book_id, last_readable_page, start_date=None):
     # TODO: if you call it again, you get a new record_id for a second reading of the same book
-    db = psycopg2.connect(**books_conf)
     if start_date is None:
         start_date = datetime.datetime.now().strftime(FMT)
-    q = "INSERT INTO complete_date_estimates (BookId, StartDate, LastReadablePage) VALUES (%s, %s, %s)"
     app.logger.debug(f"Inserting book estimate for BookId: {book_id}")
+    db = get_db_connection()
     result_data = None
     try:
         with db.cursor() as c:
             try:
-                c.execute(q, (book_id, start_date, last_readable_page))
+                c.execute(SQL_INSERT_BOOK_ESTIMATE, (book_id, start_date, last_readable_page))
                 result_data = {"add_book_estimate":
                                    {"BookId": f"{book_id}", "LastReadablePage":
                                        f"{last_readable_page}", "StartDate": f"{start_date}"}}
@@ -1016,7 +1286,7 @@ def add_book_estimate(book_id, last_readable_page, start_date=None):
                 result_data = {"add_book_estimate": {}, "error": str(e)}
         db.commit()
     finally:
-        db.close()
+        release_db_connection(db)
     return json_response(result_data)
 
 
@@ -1067,7 +1337,6 @@ def add_image():
     Returns:
         JSON response with the inserted image record including the auto-generated id
     """
-    db = psycopg2.connect(**books_conf)
     record = request.get_json()
 
     # Validate required fields
@@ -1086,19 +1355,31 @@ def add_image():
         if image_url.startswith('http://') or image_url.startswith('https://'):
             try:
                 # Make a HEAD request to check if the URL is accessible
-                response = requests.head(image_url, timeout=5, allow_redirects=True)
-
-                # If HEAD is not supported, try GET with stream
-                if response.status_code == 405:
-                    response = requests.get(image_url, timeout=5, stream=True, headers={'Range': 'bytes=0-0'})
+                response = image_check_session.head(image_url, timeout=IMAGE_CHECK_TIMEOUT, allow_redirects=True)
+                status_code, headers = response.status_code, response.headers
+
+                # If HEAD is not supported, or answers without saying what the
+                # content is, try GET with stream; the with-block closes the
+                # socket as soon as the headers are read
+                if status_code == 405 or (status_code == 200 and 'Content-Type' not in headers):
+                    with image_check_session.get(image_url, timeout=IMAGE_CHECK_TIMEOUT, stream=True,
+                                                 headers={'Range': 'bytes=0-0'}) as get_response:
+                        status_code, headers = get_response.status_code, get_response.headers
+
+                # 206 is the answer to the one-byte Range request
+                if status_code not in (200, 206):
+                    app.logger.warning(f"Image URL returned status {status_code}: {image_url}")
+                    return json_response(
+                        {"error": f"Image URL not accessible (status {status_code}): {image_url}"}, status=400)
 
-                if response.status_code != 200:
-                    app.logger.warning(f"Image URL returned status {response.status_code}: {image_url}")
+                content_length = headers.get('Content-Length', '')
+                if content_length.isdigit() and int(content_length) > MAX_IMAGE_URL_BYTES:
+                    app.logger.warning(f"Image URL too large ({content_length} bytes): {image_url}")
                     return json_response(
-                        {"error": f"Image URL not accessible (status {response.status_code}): {image_url}"}, status=400)
+                        {"error": f"Image URL too large ({content_length} bytes): {image_url}"}, status=400)
 
                 # Optionally verify it's an image by checking content-type
-                content_type = response.headers.get('Content-Type', '')
+                content_type = headers.get('Content-Type', '')
                 if not content_type.startswith('image/'):
                     app.logger.warning(f"URL does not point to an image (content-type: {content_type}): {image_url}")
                     return json_response({"error": f"URL does not appear to be an image (content-type: {content_type})"}, status=400)
@@ -1110,16 +1391,13 @@ def add_image():
                 app.logger.error(f"Error verifying image URL: {image_url} - {str(e)}")
                 return json_response({"error": f"Error verifying image URL: {str(e)}"}, status=400)
 
-    search_str = ("INSERT INTO images "
-                  "(BookId, Name, Url, ImageType) "
-                  "VALUES (%s, %s, %s, %s) RETURNING imageid")
-
+    db = get_db_connection()
     result_data = None
     try:
         with db.cursor() as c:
             try:
                 app.logger.debug(f"Inserting image for BookId: {record['BookId']}")
-                c.execute(search_str, (
+                c.execute(SQL_INSERT_IMAGE, (
                     record["BookId"],
                     record.get("Name", ""),
                     record.get("Url", ""),
@@ -1132,7 +1410,7 @@ def add_image():
                 result_data = {"error": str(e)}
         db.commit()
     finally:
-        db.close()
+        release_db_connection(db)
 
     return json_response(result_data)
 
@@ -1163,15 +1441,14 @@ def upload_image():
         return json_response({"error": "No file selected"}, status=400)
 
     # Get the configured image path
-    image_path = '/books/uploads'
+    image_path = UPLOAD_IMAGE_PATH
 
     # Ensure the directory exists
-    if not os.path.exists(image_path):
-        try:
-            os.makedirs(image_path)
-        except OSError as e:
-            app.logger.error(f"Failed to create directory {image_path}: {e}")
-            return json_response({"error": f"Failed to create directory: {str(e)}"}, status=500)
+    try:
+        os.makedirs(image_path, exist_ok=True)
+    except OSError as e:
+        app.logger.error(f"Failed to create directory {image_path}: {e}")
+        return json_response({"error": f"Failed to create directory: {str(e)}"}, status=500)
 
     # Use custom filename if provided, otherwise use secure_filename on original
     custom_filename = request.form.get('filename')
@@ -1183,7 +1460,7 @@ def upload_image():
     file_path = os.path.join(image_path, filename)
 
     try:
-        file.save(file_path)
+        save_upload(file.stream, file_path)
         app.logger.info(f"File uploaded successfully: {file_path}")
         return json_response({
             "upload_image": {
@@ -1197,36 +1474,82 @@ def upload_image():
         return json_response({"error": f"Failed to save file: {str(e)}"}, status=500)
 
 
+@app.route('/upload_image/<filename>', methods=['PUT'])
+@require_app_key
+def upload_image_raw(filename):
+    """
+    Upload raw image bytes and store them in the configured image path.
+
+    The request body is copied straight from the request stream to the
+    destination file in fixed-size chunks, without being spooled to a
+    temporary file first as multipart uploads are.
+
+    E.g.
+    curl -X PUT -H "x-api-key: YOUR_API_KEY" -H "Content-Type: image/jpeg" \
+    --data-binary @/path/to/image.jpg http://172.17.0.2:5000/upload_image/image.jpg
+
+    Returns:
+        JSON response with upload status and file path
+    """
+    filename = secure_filename(filename)
+    if not filename:
+        return json_response({"error": "No valid filename given"}, status=400)
+
+    image_path = UPLOAD_IMAGE_PATH
+    try:
+        os.makedirs(image_path, exist_ok=True)
+    except OSError as e:
+        app.logger.error(f"Failed to create directory {image_path}: {e}")
+        return json_response({"error": f"Failed to create directory: {str(e)}"}, status=500)
+
+    file_path = os.path.join(image_path, filename)
+
+    try:
+        with open(file_path, 'wb') as out_file:
+            shutil.copyfileobj(request.stream, out_file, UPLOAD_CHUNK_BYTES)
+    except Exception as e:
+        # don't leave a truncated image behind
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        if isinstance(e, HTTPException):
+            raise
+        app.logger.error(f"Failed to save file: {e}")
+        return json_response({"error": f"Failed to save file: {str(e)}"}, status=500)
+    app.logger.info(f"File uploaded successfully: {file_path}")
+    return json_response({
+        "upload_image": {
+            "status": "success",
+            "filename": filename,
+            "path": file_path
+        }
+    })
+
+
 @app.route('/image/year_progress_comparison.png')
 @app.route('/image/year_progress_comparison.png/<int:window>')
 @require_app_key
 def year_progress_comparison(window=15):
+    return png_response(year_progress_png, window)
+
+
+def year_progress_png(window):
+    """
+    Render the year progress comparison chart as PNG bytes.
+    """
     img = BytesIO()
-    _, s, h, e = books_read_by_year_utility()
+    s, h, e = year_progress_utility()
     df1 = pd.DataFrame(s, columns=h)
-    df1["read_date"] = pd.to_datetime(df1["ReadDate"])
-    df1 = df1.set_index("ReadDate")
-    df1.index = pd.to_datetime(df1.index)
-    ds_pages = df1.groupby(df1.index.to_period('Y'))["Pages"].cumsum()
-    ds_day = df1.read_date.apply(lambda x: x.dayofyear)
-    ds_year = df1.read_date.apply(lambda x: x.year)
-    df1 = pd.concat([ds_pages, ds_day, ds_year], axis=1)
-    df1.columns = ["Pages", "Day", "Year"]
-    fig_size = [8, 8]
     xlim = [0, 365]
-    ylim = [0, max(df1.Pages)]
+    ylim = [0, df1.Pages.max()]
     years = df1.Year.unique()[-window:].tolist()
     current_year = max(years)
-    y = years.pop(0)
-    _df = df1.loc[df1.Year == y]
-    ax = _df.plot("Day", "Pages", figsize=fig_size, xlim=xlim, ylim=ylim, label=y)
-    for y in years:
-        _df = df1.loc[df1.Year == y]
+    fig = new_figure([8, 8])
+    ax = fig.add_subplot(111)
+    for y, _df in df1[df1.Year.isin(years)].groupby("Year"):
         lw = 1 if y != current_year else 4
-        ax = _df.plot("Day", "Pages", figsize=fig_size, xlim=xlim, ylim=ylim, ax=ax, label=y, lw=lw)
-    plt.savefig(img, format='png')
-    img.seek(0)
-    return send_file(img, mimetype='image/png')
+        ax = _df.plot("Day", "Pages", xlim=xlim, ylim=ylim, ax=ax, label=y, lw=lw)
+    fig.savefig(img, format='png', dpi=CHART_DPI, bbox_inches=None)
+    return img.getvalue()
 
 
 @app.route('/image/all_years.png')
@@ -1235,6 +1558,13 @@ def year_progress_comparison(window=15):
 def all_years(year=None):
     if year is None:
         year = datetime.datetime.now().year
+    return png_response(all_years_png, year)
+
+
+def all_years_png(year):
+    """
+    Render the all-years reading statistics chart as PNG bytes.
+    """
     img = BytesIO()
     s, h, e = summary_books_read_by_year_utility()
     df = pd.DataFrame(s, columns=h)
@@ -1247,15 +1577,65 @@ def all_years(year=None):
         year = df.year.unique().max()
     now_df = df.loc[df["year"] == year]
     app.logger.debug(now_df)
-    fig, axs = plt.subplots(3, 1, figsize=[10, 18])
+    fig = new_figure([10, 18])
+    axs = fig.subplots(3, 1)
     df.hist("pages read", bins=14, color="darkblue", ax=axs[0])
     axs[0].axvline(x=int(now_df["pages read"].iloc[0]), color="red")
     df.plot.bar(x="rank", y="pages read", width=.95, color="darkblue", ax=axs[1])
     axs[1].axvline(x=int(now_df["rank"].iloc[0]) - 1, color="red")
     df.sort_values("year").plot.bar(x="year", y="pages read", width=.95, color="darkblue", ax=axs[2])
-    fig.savefig(img, format='png')
-    img.seek(0)
-    return send_file(img, mimetype='image/png')
+    fig.savefig(img, format='png', dpi=CHART_DPI, bbox_inches=None)
+    return img.getvalue()
+
+
+def new_figure(figsize):
+    """
+    Create a figure drawn directly on an Agg canvas.
+
+    The figure is never registered with pyplot, so nothing has to close it and
+    concurrent renders in one worker share no global state.
+    """
+    # matplotlib is only needed by the chart routes; keep it out of worker start-up
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def png_response(render, key):
+    """
+    Send a chart rendered by one of the *_png functions.
+
+    Renders are cached as files in CHART_CACHE_PATH named for the chart, its
+    argument and the current reading_data_version, so all workers share them
+    and a change to the reading data renders afresh.  If the version lookup or
+    the cache directory fails, the chart is rendered and sent from memory.
+    """
+    data_version = reading_data_version()
+    if data_version is not None:
+        prefix = f"{render.__name__}-{key}-"
+        token = hashlib.sha1(repr(data_version).encode()).hexdigest()[:16]
+        file_path = os.path.join(CHART_CACHE_PATH, f"{prefix}{token}.png")
+        try:
+            if not os.path.exists(file_path):
+                png = render(key)
+                os.makedirs(CHART_CACHE_PATH, exist_ok=True)
+                # write under a temporary name so no request sees a partial file
+                with tempfile.NamedTemporaryFile(dir=CHART_CACHE_PATH, delete=False) as tmp_file:
+                    tmp_file.write(png)
+                os.replace(tmp_file.name, file_path)
+                # drop the renders this one supersedes
+                for old_path in glob.glob(os.path.join(CHART_CACHE_PATH, f"{prefix}*.png")):
+                    if old_path != file_path:
+                        try:
+                            os.remove(old_path)
+                        except FileNotFoundError:
+                            pass
+            return send_file(file_path, mimetype='image/png')
+        except OSError as e:
+            app.logger.error(f"Failed to cache chart {file_path}: {e}")
+    return send_file(BytesIO(render(key)), mimetype='image/png')
 
 
 if __name__ == "__main__":
@@ -5,14 +5,18 @@ This module provides database access functions for the books collection.
 It imports from sub-modules for configuration and serialization.
 """
 import datetime
+import functools
+import time
 import numpy as np
 import psycopg2
+import psycopg2.extras
 import requests
 
 # Import from sub-modules for modular organization
 from .config import (
     app_logger,
     table_header,
+    books_read_header,
     locations_sort_order,
     FMT,
     API_KEY,
@@ -24,6 +28,8 @@ from .config import (
     EMBED_API_KEY,
     EMBED_DIMENSIONS,
 )
+from .db_pool import get_db_connection, release_db_connection
+from .insert_batcher import InsertBatcher
 from .serialization import (
     sort_list_by_index_list,
     serialized_result_dict,
@@ -37,18 +43,23 @@ __all__ = [
     # Third-party modules used by api.py directly
     'psycopg2', 'datetime',
     # Config exports
-    'app_logger', 'table_header', 'locations_sort_order', 'FMT',
+    'app_logger', 'table_header', 'books_read_header', 'locations_sort_order', 'FMT',
     'API_KEY', 'read_json_configuration', 'books_conf', 'isbn_conf',
+    # Connection pool exports
+    'get_db_connection', 'release_db_connection', 'InsertBatcher',
     # Serialization exports
     'sort_list_by_index_list', 'serialized_result_dict',
     '_convert_db_types', '_create_serializeable_result_dict',
     # Functions defined in this module
     'get_valid_locations', 'get_recently_touched', 'get_next_book_id',
     'get_book_ids_in_window', 'get_complete_book_record',
-    'update_book_record_by_key', 'summary_books_read_by_year_utility',
-    'books_read_by_year_utility', 'status_read_utility',
-    'tags_search_utility', 'books_search_utility', 'book_tags',
-    'get_tag_counts', 'add_tag_to_book', 'get_images_for_book',
+    'update_book_record_by_key', 'update_book_records_bulk',
+    'summary_books_read_by_year_utility',
+    'books_read_by_year_utility', 'iter_books_read_by_year',
+    'year_progress_utility',
+    'reading_data_version', 'status_read_utility',
+    'tags_search_utility', 'clear_tag_counts', 'books_search_utility', 'book_tags',
+    'get_tag_counts', 'add_tag_to_book', 'add_tags_to_book', 'get_images_for_book',
     'delete_book', 'get_complete_records_by_ids',
     'daily_page_record_from_db', 'reading_book_data_from_db',
     'update_reading_book_data', 'estimate_completion_dates',
@@ -92,7 +103,7 @@ def get_valid_locations():
     db = None
     error_list = None
     try:
-        db = psycopg2.connect(**books_conf)
+        db = get_db_connection()
         cursor = db.cursor()
 
         # Execute the query
@@ -109,9 +120,9 @@ def get_valid_locations():
         app_logger.error(e)
         error_list = [str(e)]
     finally:
-        # Ensure the database connection is closed
+        # Return the connection to the pool
         if db:
-            db.close()
+            release_db_connection(db)
     return sorted_locations_list, locations, ["Location"], error_list
 
 
@@ -160,7 +171,7 @@ def get_recently_touched(limit=10):
     s = None
 
     try:
-        db = psycopg2.connect(**books_conf)
+        db = get_db_connection()
         cursor = db.cursor()
 
         # Execute the query - get most recently touched books from all tables
@@ -189,19 +200,17 @@ def get_recently_touched(limit=10):
 
         # Fetch and process the results
         s = cursor.fetchall()
-        for a, b, c in s:
-            _date = b.strftime(FMT) if b else None
-            _title = c if len(c) <= 43 else c[:40] + "..."
-            recent_books.append([a, _date, _title])
+        recent_books = [[a, b.strftime(FMT) if b else None, c if len(c) <= 43 else c[:40] + "..."]
+                        for a, b, c in s]
 
     except psycopg2.Error as e:
         # Log and handle database errors
         app_logger.error(e)
         error_list = [str(e)]
     finally:
-        # Ensure the database connection is closed
+        # Return the connection to the pool
         if db:
-            db.close()
+            release_db_connection(db)
 
     return recent_books, s, header, error_list
 
@@ -217,9 +226,9 @@ def get_next_book_id(current_book_id, direction=1):
     Summary:
         Retrieves the next BookId from the ``books`` table in
         the database. The function uses the current ID and a direction
-        flag to determine whether to look forward or backward. When the search
-        reaches the end of the table it wraps around to the first or last
-        entry, depending on the direction.
+        flag to determine whether to look forward or backward. Searching
+        backward from the first book wraps around to the last; searching
+        forward from the last book does not wrap.
 
     Parameters:
         current_book_id (int): The current book collection identifier.
@@ -228,52 +237,34 @@ def get_next_book_id(current_book_id, direction=1):
             Defaults to 1.
 
     Returns:
-        int or None: The next book collection ID, or None if a database
-        error occurs.
+        int or None: The next book collection ID, or None past the last
+        book or if a database error occurs.
 
     Raises:
         psycopg2.Error: If an error occurs during the database query.
     """
-    db = psycopg2.connect(**books_conf)
-    # Direction determines comparison operator and sort order (safe - derived from int)
+    # Direction determines comparison operator and sort order (safe - derived from int);
+    # forward past the last book yields NULL (no forward wrap), backward past the
+    # first book the COALESCE wraps around to the last
     if direction > 0:
-        query_str = ("SELECT a.BookId FROM books as a "
-                     "WHERE a.BookId > %s ORDER BY a.BookId ASC LIMIT 1")
+        query_str = ("SELECT (SELECT a.BookId FROM books as a WHERE a.BookId > %s "
+                     "ORDER BY a.BookId ASC LIMIT 1)")
     else:
-        query_str = ("SELECT a.BookId FROM books as a "
-                     "WHERE a.BookId < %s ORDER BY a.BookId DESC LIMIT 1")
+        query_str = ("SELECT COALESCE("
+                     "(SELECT a.BookId FROM books as a WHERE a.BookId < %s ORDER BY a.BookId DESC LIMIT 1), "
+                     "(SELECT max(a.BookId) FROM books as a))")
     app_logger.debug(query_str)
     next_book_id = None
+    db = get_db_connection()
     try:
-        c = db.cursor()
-        try:
+        with db.cursor() as c:
             c.execute(query_str, (current_book_id,))
-        except psycopg2.Error as e:
-            app_logger.error(e)
-            return next_book_id
-        else:
-            s = c.fetchall()
-            # If no results, we are at a boundary
-            if len(s) == 0:
-                if direction > 0:
-                    # At the end of the collection — do not wrap forward
-                    next_book_id = None
-                else:
-                    # At the start of the collection — wrap backward to the last book
-                    query_str = "SELECT max(a.BookId) FROM books as a"
-                    c = db.cursor()
-                    try:
-                        c.execute(query_str)
-                    except psycopg2.Error as e:
-                        app_logger.error(e)
-                    else:
-                        s = c.fetchall()
-                        next_book_id = s[0][0]
-            else:
-                next_book_id = s[0][0]
-            return next_book_id
+            next_book_id = c.fetchone()[0]
+    except psycopg2.Error as e:
+        app_logger.error(e)
     finally:
-        db.close()
+        release_db_connection(db)
+    return next_book_id
 
 
 def get_book_ids_in_window(book_id, window):
@@ -306,129 +297,92 @@ def get_book_ids_in_window(book_id, window):
     Raises
     ------
     psycopg2.Error
-        If a database query fails, the exception is logged but not
-        propagated; the function continues with whatever results were
-        retrieved so far.
+        If the database query fails, the exception is logged but not
+        propagated and an empty list is returned.
     """
-    db = psycopg2.connect(**books_conf)
     app_logger.debug(f"Getting book ID window for book ID {book_id} with window {window}")
     top_half_window = int((window + 1) / 2)
     bottom_half_window = window - top_half_window
 
-    # Query templates with parameterized book_id and limit
-    # Comparison operator and order are safe (hardcoded strings)
-    queries = {
-        "le_desc": "SELECT a.BookId FROM books as a WHERE a.BookId <= %s ORDER BY a.BookId DESC LIMIT %s",
-        "gt_desc": "SELECT a.BookId FROM books as a WHERE a.BookId > %s ORDER BY a.BookId DESC LIMIT %s",
-        "gt_asc": "SELECT a.BookId FROM books as a WHERE a.BookId > %s ORDER BY a.BookId ASC LIMIT %s",
-        "le_asc": "SELECT a.BookId FROM books as a WHERE a.BookId <= %s ORDER BY a.BookId ASC LIMIT %s",
-    }
+    # Up to a full window on each side of book_id in one round trip, tagged
+    # with the side it came from; the split is worked out below
+    query = ("(SELECT 0, a.BookId FROM books as a WHERE a.BookId <= %s ORDER BY a.BookId DESC LIMIT %s) "
+             "UNION ALL "
+             "(SELECT 1, a.BookId FROM books as a WHERE a.BookId > %s ORDER BY a.BookId ASC LIMIT %s)")
 
     book_id_list = []
+    db = get_db_connection()
     try:
-        c = db.cursor()
-
-        # get the bottom half first - window leading up to book_id
-        try:
-            c.execute(queries["le_desc"], (book_id, bottom_half_window))
+        with db.cursor() as c:
+            c.execute(query, (book_id, window, book_id, window))
             s = c.fetchall()
-            for row in s:
-                book_id_list.append(row[0])
-            book_id_list.reverse()
-        except psycopg2.Error as e:
-            app_logger.error(e)
+        # closest to book_id first on both sides
+        below = sorted((row[1] for row in s if row[0] == 0), reverse=True)
+        above = sorted(row[1] for row in s if row[0] == 1)
 
         # If fewer books exist below the anchor, expand the top half to compensate
-        below_deficit = bottom_half_window - len(book_id_list)
-        effective_top = top_half_window + below_deficit
-
-        # now get the top half - window after book_id
-        try:
-            c.execute(queries["gt_asc"], (book_id, effective_top))
-            s = c.fetchall()
-            for row in s:
-                book_id_list.append(row[0])
-        except psycopg2.Error as e:
-            app_logger.error(e)
-
+        below_deficit = max(bottom_half_window - len(below), 0)
+        above = above[:top_half_window + below_deficit]
         # If fewer books exist above the anchor, expand the bottom half to compensate
-        if len(book_id_list) < window:
-            above_deficit = window - len(book_id_list)
-            try:
-                c.execute(queries["le_desc"], (book_id, bottom_half_window + above_deficit))
-                s = c.fetchall()
-                new_below = [row[0] for row in s]
-                new_below.reverse()
-                # Prepend only IDs not already in the list
-                existing = set(book_id_list)
-                extra = [bid for bid in new_below if bid not in existing]
-                book_id_list = extra + book_id_list
-            except psycopg2.Error as e:
-                app_logger.error(e)
+        below = below[:window - len(above)]
+        below.reverse()
+        book_id_list = below + above
+    except psycopg2.Error as e:
+        app_logger.error(e)
     finally:
-        db.close()
+        release_db_connection(db)
 
     return book_id_list
 
 
 def get_complete_book_record(book_id):
-    """Retrieve complete book record including reads, tags, and images."""
-    db = psycopg2.connect(**books_conf)
+    """
+    Retrieve complete book record including reads, tags, and images.
 
-    q_book = ("SELECT a.BookId, a.Title, a.Author, a.CopyrightDate, "
-              "a.IsbnNumber, a.PublisherName, a.CoverType, a.Pages, "
-              "a.BookNote, a.Recycled, a.Location, a.IsbnNumber13 "
-              "FROM books as a WHERE a.BookId = %s")
+    The book row and its reads, tags and cover images come back from one
+    query, as the book's columns followed by one array per related list, so
+    the record costs a single round trip.
+    """
+    # the one-row key keeps a result row, of NULLs and empty arrays, for a
+    # BookId that doesn't exist
+    query = ("SELECT a.BookId, a.Title, a.Author, a.CopyrightDate, "
+             "a.IsbnNumber, a.PublisherName, a.CoverType, a.Pages, "
+             "a.BookNote, a.Recycled, a.Location, a.IsbnNumber13, "
+             "ARRAY(SELECT b.ReadDate FROM books_read as b "
+             "WHERE b.BookId = k.BookId ORDER BY b.ReadDate), "
+             "ARRAY(SELECT b.ReadNote FROM books_read as b "
+             "WHERE b.BookId = k.BookId ORDER BY b.ReadDate), "
+             "ARRAY(SELECT t.Label FROM books_tags as bt JOIN tag_labels as t "
+             "ON t.TagId = bt.TagId WHERE bt.BookId = k.BookId), "
+             "ARRAY(SELECT i.Url FROM images as i "
+             "WHERE i.BookId = k.BookId AND i.ImageType = 'cover-face' ORDER BY i.ImageId) "
+             "FROM (SELECT %s::INT as BookId) as k "
+             "LEFT JOIN books as a ON a.BookId = k.BookId")
     h_book = table_header
-
-    q_read = "SELECT b.ReadDate, b.ReadNote FROM books_read as b WHERE b.BookId = %s"
     h_read = ["DateRead", "ReadNote"]
-
-    q_tags = ("SELECT b.Label FROM books_tags as a JOIN tag_labels as b "
-              "ON b.TagId = a.TagId WHERE a.BookId = %s")
     h_tags = ["Tag"]
-
-    q_img = ("SELECT a.Url FROM images as a "
-             "WHERE a.BookId = %s AND a.ImageType = 'cover-face'")
     h_img = ["ImageURL"]
 
     result_data = {"book": None, "reads": None, "tags": None, "img": None, "error": []}
+    app_logger.debug(query)
+    db = get_db_connection()
     try:
-        c = db.cursor()
-
-        try:
-            c.execute(q_book, (book_id,))
-            s = c.fetchall()
-            result_data["book"] = _create_serializeable_result_dict(s, h_book)
-        except psycopg2.Error as e:
-            app_logger.error(e)
-            result_data["error"].append(str(e))
-
-        try:
-            c.execute(q_read, (book_id,))
-            s = c.fetchall()
-            result_data["reads"] = _create_serializeable_result_dict(s, h_read)
-        except psycopg2.Error as e:
-            app_logger.error(e)
-            result_data["error"].append(str(e))
-
-        try:
-            c.execute(q_tags, (book_id,))
-            s = c.fetchall()
-            result_data["tags"] = _create_serializeable_result_dict([[x[0] for x in s]], h_tags)
-        except psycopg2.Error as e:
-            app_logger.error(e)
-            result_data["error"].append(str(e))
-
-        try:
-            c.execute(q_img, (book_id,))
-            s = c.fetchall()
-            result_data["img"] = _create_serializeable_result_dict([[x[0] for x in s]], h_img)
-        except psycopg2.Error as e:
-            app_logger.error(e)
-            result_data["error"].append(str(e))
+        with db.cursor() as c:
+            c.execute(query, (book_id,))
+            row = c.fetchone()
+        n_book = len(h_book)
+        book_rows = [row[:n_book]] if row[0] is not None else []
+        read_dates, read_notes, tags, images = row[n_book:]
+        result_data["book"] = _create_serializeable_result_dict(book_rows, h_book)
+        result_data["reads"] = _create_serializeable_result_dict(
+            list(zip(read_dates, read_notes)), h_read)
+        result_data["tags"] = _create_serializeable_result_dict([tags], h_tags)
+        result_data["img"] = _create_serializeable_result_dict([images], h_img)
+    except psycopg2.Error as e:
+        app_logger.error(e)
+        result_data["error"].append(str(e))
     finally:
-        db.close()
+        release_db_connection(db)
 
     if len(result_data["error"]) == 0:
         del result_data["error"]
@@ -454,6 +408,8 @@ def update_book_record_by_key(update_dict):
     represent the columns to update and their new values. If an error occurs while
     executing the SQL operation, an error dictionary will be returned.
 
+    This is a one-record call into :func:`update_book_records_bulk`.
+
     :param update_dict: A dictionary containing the record information for the book to
         be updated. The keys represent the column names, and the values represent
         the new data to be inserted for those columns.
@@ -463,51 +419,89 @@ def update_book_record_by_key(update_dict):
         returned.
     :rtype: list
     """
-    # Allowed column names for update (whitelist to prevent SQL injection)
-    allowed_columns = {
-        "Title", "Author", "CopyrightDate", "IsbnNumber", "IsbnNumber13",
-        "PublisherName", "CoverType", "Pages", "BookNote",
-        "Recycled", "Location"
-    }
-
-    db = psycopg2.connect(**books_conf)
-    book_collection_id = update_dict.get("BookId")
-    if not book_collection_id:
-        db.close()
-        return [{"error": "BookId is required"}]
-
-    # Build SET clause with parameterized values
-    set_parts = []
-    values = []
-    for key, value in update_dict.items():
-        if key == "BookId":
+    return update_book_records_bulk([update_dict])
+
+
+# Allowed column names for update (whitelist to prevent SQL injection)
+UPDATABLE_BOOK_COLUMNS = frozenset({
+    "Title", "Author", "CopyrightDate", "IsbnNumber", "IsbnNumber13",
+    "PublisherName", "CoverType", "Pages", "BookNote",
+    "Recycled", "Location"
+})
+
+
+def update_book_records_bulk(updates):
+    """
+    Updates many book records, one UPDATE statement per distinct set of columns.
+
+    Records that change the same columns share one parameterized UPDATE run
+    with ``execute_batch``, so a bulk edit costs a round trip per group of
+    records rather than per record.  If a group fails, its records are retried
+    one at a time so each still gets its own result.
+
+    :param updates: Dictionaries as taken by :func:`update_book_record_by_key`,
+        each with a ``BookId`` and the columns to change.
+    :type updates: list[dict]
+    :return: One result per record, in input order: the record dictionary on
+        success, otherwise an error dictionary.
+    :rtype: list
+    """
+    results = [None] * len(updates)
+    groups = {}
+    for n, update_dict in enumerate(updates):
+        book_collection_id = update_dict.get("BookId")
+        if not book_collection_id:
+            results[n] = {"error": "BookId is required"}
             continue
-        if key not in allowed_columns:
-            app_logger.warning(f"Ignoring unknown column: {key}")
+        columns = []
+        for key in update_dict:
+            if key == "BookId":
+                continue
+            if key not in UPDATABLE_BOOK_COLUMNS:
+                app_logger.warning(f"Ignoring unknown column: {key}")
+                continue
+            columns.append(key)
+        if not columns:
+            results[n] = {"error": "No valid columns to update"}
             continue
-        set_parts.append(f"{key} = %s")
-        values.append(value)
+        # the same columns in any key order share a statement
+        columns = tuple(sorted(columns))
+        values = tuple(update_dict[key] for key in columns) + (book_collection_id,)
+        groups.setdefault(columns, []).append((n, values))
 
-    if not set_parts:
-        db.close()
-        return [{"error": "No valid columns to update"}]
+    if not groups:
+        return results
 
-    values.append(book_collection_id)
-    search_str = f"UPDATE books SET {', '.join(set_parts)} WHERE BookId = %s"
-    app_logger.debug(search_str)
-
-    results = []
+    db = get_db_connection()
     try:
-        with db.cursor() as c:
+        for columns, rows in groups.items():
+            search_str = f"UPDATE books SET {', '.join(f'{key} = %s' for key in columns)} WHERE BookId = %s"
+            app_logger.debug(search_str)
             try:
-                c.execute(search_str, tuple(values))
-                results.append(update_dict)
+                with db.cursor() as c:
+                    psycopg2.extras.execute_batch(c, search_str, [values for _, values in rows])
+                db.commit()
+                for n, _ in rows:
+                    results[n] = updates[n]
             except psycopg2.Error as e:
-                app_logger.error(e)
-                results.append({"error": str(e)})
-        db.commit()
+                db.rollback()
+                if len(rows) == 1:
+                    app_logger.error(e)
+                    results[rows[0][0]] = {"error": str(e)}
+                    continue
+                app_logger.debug(f"batch of {len(rows)} updates failed, retrying individually: {e}")
+                for n, values in rows:
+                    try:
+                        with db.cursor() as c:
+                            c.execute(search_str, values)
+                        db.commit()
+                        results[n] = updates[n]
+                    except psycopg2.Error as e:
+                        db.rollback()
+                        app_logger.error(e)
+                        results[n] = {"error": str(e)}
     finally:
-        db.close()
+        release_db_connection(db)
     return results
 
 
@@ -527,7 +521,7 @@ def summary_books_read_by_year_utility(target_year=None):
     tuple: A tuple containing the serialized result, raw data, and header.
     """
     error_list = None
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     cursor = db.cursor()
 
     # Build query with optional year filter
@@ -537,10 +531,10 @@ def summary_books_read_by_year_utility(target_year=None):
             "SELECT EXTRACT(YEAR FROM b.ReadDate)::INT as Year, SUM(a.Pages) as Pages, COUNT(a.Pages) as Books "
             "FROM books as a JOIN books_read as b "
             "ON a.BookId = b.BookId "
-            "WHERE b.ReadDate is not NULL AND EXTRACT(YEAR FROM b.ReadDate)::INT = %s "
+            "WHERE b.ReadDate >= %s AND b.ReadDate < %s "
             "GROUP BY EXTRACT(YEAR FROM b.ReadDate) ORDER BY EXTRACT(YEAR FROM b.ReadDate) ASC"
         )
-        params = (int(target_year),)
+        params = _year_range(target_year)
     else:
         query = (
             "SELECT EXTRACT(YEAR FROM b.ReadDate)::INT as Year, SUM(a.Pages) as Pages, COUNT(a.Pages) as Books "
@@ -561,7 +555,7 @@ def summary_books_read_by_year_utility(target_year=None):
         error_list = [str(e)]
         results = None
     finally:
-        db.close()
+        release_db_connection(db)
 
     return results, headers, error_list
 
@@ -571,8 +565,7 @@ def books_read_by_year_utility(target_year=None):
     Retrieves books that have been read from the database, optionally filtered by a
     specific year.
 
-    This function connects to the database using the connection parameters
-    defined in ``books_conf``. It builds a SQL query that joins the
+    This function borrows a connection from the pool. It builds a SQL query that joins the
     ``books`` table with the ``books_read`` table to fetch details for
     every book that has a non‑null ``ReadDate``.  If ``target_year`` is supplied,
     the query is restricted to entries whose ``ReadDate`` falls within that
@@ -606,30 +599,10 @@ def books_read_by_year_utility(target_year=None):
         propagated.
     """
     error_list = None
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
 
-    params = ()
-    if target_year is not None:
-        search_str = ("SELECT a.BookId, a.Title, a.Author, a.CopyrightDate, "
-                      "a.IsbnNumber, a.PublisherName, a.CoverType, a.Pages, "
-                      "a.BookNote, a.Recycled, a.Location, a.IsbnNumber13, "
-                      "b.ReadDate "
-                      "FROM books as a JOIN books_read as b "
-                      "ON a.BookId = b.BookId "
-                      "WHERE b.ReadDate is not NULL AND EXTRACT(YEAR FROM b.ReadDate)::INT = %s "
-                      "ORDER BY b.ReadDate, a.BookId ASC")
-        params = (int(target_year),)
-    else:
-        search_str = ("SELECT a.BookId, a.Title, a.Author, a.CopyrightDate, "
-                      "a.IsbnNumber, a.PublisherName, a.CoverType, a.Pages, "
-                      "a.BookNote, a.Recycled, a.Location, a.IsbnNumber13, "
-                      "b.ReadDate "
-                      "FROM books as a JOIN books_read as b "
-                      "ON a.BookId = b.BookId "
-                      "WHERE b.ReadDate is not NULL "
-                      "ORDER BY b.ReadDate, a.BookId ASC")
-
-    header = table_header + ["ReadDate"]
+    search_str, params = _books_read_query(target_year)
+    header = books_read_header
     app_logger.debug(search_str)
     s = None
     try:
@@ -641,10 +614,135 @@ def books_read_by_year_utility(target_year=None):
             app_logger.error(e)
             error_list = [str(e)]
     finally:
-        db.close()
+        release_db_connection(db)
     return s, s, header, error_list
 
 
+def iter_books_read_by_year(target_year=None, chunk_size=1000):
+    """
+    Yield the rows of ``books_read_by_year_utility`` without materializing them.
+
+    The rows are read through a server-side cursor ``chunk_size`` at a time,
+    so memory stays bounded however many books have been read.  A pooled
+    connection is held until the generator is exhausted or closed.
+
+    Parameters
+    ----------
+    target_year : int, optional
+        When supplied, only books read in ``target_year`` are yielded.
+    chunk_size : int, optional
+        Rows fetched from the server per round trip (default: 1000).
+
+    Yields
+    ------
+    tuple
+        One row per read record, in the columns of ``books_read_header``.
+
+    Raises
+    ------
+    psycopg2.Error
+        If the query fails; the connection is returned to the pool first.
+    """
+    search_str, params = _books_read_query(target_year)
+    app_logger.debug(search_str)
+    db = get_db_connection()
+    try:
+        with db.cursor(name="iter_books_read") as c:
+            c.itersize = chunk_size
+            c.execute(search_str, params)
+            yield from c
+    finally:
+        release_db_connection(db)
+
+
+def _books_read_query(target_year):
+    # the query behind books_read_by_year_utility and iter_books_read_by_year
+    search_str = ("SELECT a.BookId, a.Title, a.Author, a.CopyrightDate, "
+                  "a.IsbnNumber, a.PublisherName, a.CoverType, a.Pages, "
+                  "a.BookNote, a.Recycled, a.Location, a.IsbnNumber13, "
+                  "b.ReadDate "
+                  "FROM books as a JOIN books_read as b "
+                  "ON a.BookId = b.BookId "
+                  "WHERE b.ReadDate is not NULL ")
+    if target_year is None:
+        return search_str + "ORDER BY b.ReadDate, a.BookId ASC", ()
+    search_str += ("AND b.ReadDate >= %s AND b.ReadDate < %s "
+                   "ORDER BY b.ReadDate, a.BookId ASC")
+    return search_str, _year_range(target_year)
+
+
+def _year_range(target_year):
+    # [Jan 1st of target_year, Jan 1st of the next year): a range on ReadDate can
+    # use idx_books_read_date, where EXTRACT(YEAR FROM ReadDate) = year cannot
+    year = int(target_year)
+    return datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1)
+
+
+def year_progress_utility():
+    """
+    Cumulative pages read through each year, one row per read record.
+
+    The day of year, year and running page total within the year are
+    computed by the query, so the year progress chart plots the rows as is.
+
+    Returns:
+    tuple: (rows of (Pages, Day, Year) in read order, header, error_list);
+    rows is None if the query failed.
+    """
+    error_list = None
+    db = get_db_connection()
+    query = ("SELECT SUM(COALESCE(a.Pages, 0)) OVER ("
+             "PARTITION BY EXTRACT(YEAR FROM b.ReadDate) "
+             "ORDER BY b.ReadDate, a.BookId ROWS UNBOUNDED PRECEDING)::INT as Pages, "
+             "EXTRACT(DOY FROM b.ReadDate)::INT as Day, "
+             "EXTRACT(YEAR FROM b.ReadDate)::INT as Year "
+             "FROM books as a JOIN books_read as b "
+             "ON a.BookId = b.BookId "
+             "WHERE b.ReadDate is not NULL "
+             "ORDER BY b.ReadDate, a.BookId ASC")
+    header = ["Pages", "Day", "Year"]
+    app_logger.debug(query)
+    s = None
+    try:
+        with db.cursor() as c:
+            c.execute(query)
+            s = c.fetchall()
+    except psycopg2.Error as e:
+        app_logger.error(e)
+        error_list = [str(e)]
+    finally:
+        release_db_connection(db)
+    return s, header, error_list
+
+
+def reading_data_version():
+    """
+    Cheap fingerprint of the data behind the reading charts.
+
+    Any insert, update or delete of a read record, and any book update,
+    changes the result, so it can key a cache of rendered charts.
+
+    Returns:
+    tuple or None: (read record count, latest books_read update, latest books
+    update), or None if the query failed.
+    """
+    db = get_db_connection()
+    query = ("SELECT (SELECT COUNT(*) FROM books_read), "
+             "(SELECT MAX(LastUpdate) FROM books_read), "
+             "(SELECT MAX(LastUpdate) FROM books)")
+    app_logger.debug(query)
+    version = None
+    try:
+        with db.cursor() as c:
+            c.execute(query)
+            version = c.fetchone()
+    except psycopg2.Error as e:
+        app_logger.error(e)
+    finally:
+        release_db_connection(db)
+    return version
+
+
 def status_read_utility(book_id):
     """
     Retrieve the read status for a specified book from the database.
@@ -661,7 +759,7 @@ def status_read_utility(book_id):
               occurred during execution, or ``None`` if the query succeeded.
     """
     error_list = None
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     search_str = ("SELECT BookId, ReadDate, ReadNote "
                   "FROM books_read "
                   "WHERE BookId = %s ORDER BY ReadDate ASC")
@@ -677,7 +775,7 @@ def status_read_utility(book_id):
             app_logger.error(e)
             error_list = [str(e)]
     finally:
-        db.close()
+        release_db_connection(db)
     return s, header, error_list
 
 
@@ -706,7 +804,8 @@ def tags_search_utility(match_str):
     """
     match_str = match_str.lower().strip()
     error_list = None
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
+    # LIKE '%x%' on Label can use idx_tag_labels_label_trgm (database/add_tag_label_trgm_index.sql)
     search_str = ("SELECT a.BookId, b.TagId, b.Label as Tag"
                   " FROM books_tags a JOIN tag_labels b ON a.TagId=b.TagId"
                   " WHERE b.Label LIKE %s"
@@ -723,15 +822,48 @@ def tags_search_utility(match_str):
             app_logger.error(e)
             error_list = [str(e)]
     finally:
-        db.close()
+        release_db_connection(db)
     return s, header, error_list
 
 
+# Allowed search columns (whitelist to prevent SQL injection)
+SEARCHABLE_BOOK_COLUMNS = frozenset({
+    "BookId", "Title", "Author", "CopyrightDate", "IsbnNumber",
+    "IsbnNumber13", "PublisherName", "CoverType", "Pages",
+    "BookNote", "Recycled", "Location"
+})
+
+_SEARCH_PREFIX = ("SELECT a.BookId, a.Title, a.Author, a.CopyrightDate, "
+                  "a.IsbnNumber, a.PublisherName, a.CoverType, a.Pages, "
+                  "a.BookNote, a.Recycled, a.Location, a.IsbnNumber13, "
+                  "b.ReadDate "
+                  "FROM books as a LEFT JOIN books_read as b "
+                  "ON a.BookId = b.BookId")
+_SEARCH_SUFFIX = " ORDER BY a.Author, a.Title ASC"
+
+
+def _like_pattern(value):
+    return f"%{value}%"
+
+
+# WHERE fragment and parameter builder for each search key
+_SEARCH_FILTERS = {key: (f"a.{key} LIKE %s", _like_pattern) for key in SEARCHABLE_BOOK_COLUMNS}
+_SEARCH_FILTERS.update({
+    "BookId": ("a.BookId = %s", lambda value: value),
+    "ReadDate": ("b.ReadDate LIKE %s", _like_pattern),
+    # Books with a tag matching as in tags_search_utility, resolved in
+    # the same statement rather than by a separate tag query
+    "Tags": ("a.BookId IN (SELECT bt.BookId FROM books_tags as bt "
+             "JOIN tag_labels as t ON t.TagId = bt.TagId WHERE t.Label LIKE %s)",
+             lambda value: _like_pattern(value.lower().strip())),
+})
+
+
 def books_search_utility(args):
     """
     This function searches a book collection database for records matching the provided criteria.
 
-    The function builds a SQL query dynamically based on the keys in the `args` dictionary.  Certain keys are treated specially – for example, a key of `"BookId"` is matched exactly, while `"ReadDate"` is matched using a `LIKE` pattern.  The `"Tags"` key triggers a call to `tags_search_utility`, converting a list of tag identifiers into a tuple used in a sub‑query.  All other keys are compared using a `LIKE` clause.
+    The function builds a SQL query dynamically based on the keys in the `args` dictionary.  Certain keys are treated specially – for example, a key of `"BookId"` is matched exactly, while `"ReadDate"` is matched using a `LIKE` pattern.  The `"Tags"` key filters on books whose tag labels match, through a sub‑query on the tag tables.  All other keys are compared using a `LIKE` clause.
 
     The query joins the ``books`` table with the ``books_read`` table.  If any conditions are supplied, they are added to a `WHERE` clause; the results are ordered by author and title.  The function logs the final query for debugging purposes.
 
@@ -745,8 +877,8 @@ def books_search_utility(args):
 
         * ``BookId`` – exact match on the book ID.
         * ``ReadDate`` – matched using a ``LIKE`` pattern.
-        * ``Tags`` – the value is passed to ``tags_search_utility``; the resulting
-          tag IDs are used to filter the book IDs.
+        * ``Tags`` – books with a tag label containing the value, matched as in
+          ``tags_search_utility``.
         * All other keys – matched using a ``LIKE`` pattern against the column
           of the same name in the ``books`` table.
 
@@ -765,56 +897,27 @@ def books_search_utility(args):
           occurred during query execution, or ``None`` if no errors were
           encountered.
     """
-    # Allowed search columns (whitelist to prevent SQL injection)
-    allowed_book_columns = {
-        "BookId", "Title", "Author", "CopyrightDate", "IsbnNumber",
-        "IsbnNumber13", "PublisherName", "CoverType", "Pages",
-        "BookNote", "Recycled", "Location"
-    }
-
     error_list = None
     s = None
-    db = psycopg2.connect(**books_conf)
     where_parts = []
     params = []
 
     for key in args:
-        value = args.get(key)
-        if key == "BookId":
-            where_parts.append("a.BookId = %s")
-            params.append(value)
-        elif key == "ReadDate":
-            where_parts.append("b.ReadDate LIKE %s")
-            params.append(f"%{value}%")
-        elif key == "Tags":
-            # Get book IDs matching the tag
-            tag_results, _, _ = tags_search_utility(value)
-            if tag_results:
-                book_ids = [int(x[0]) for x in tag_results]
-                placeholders = ", ".join(["%s"] * len(book_ids))
-                where_parts.append(f"a.BookId IN ({placeholders})")
-                params.extend(book_ids)
-            else:
-                # No matching tags - force no results
-                where_parts.append("a.BookId IN (0)")
-        elif key in allowed_book_columns:
-            where_parts.append(f"a.{key} LIKE %s")
-            params.append(f"%{value}%")
-        else:
+        if key not in _SEARCH_FILTERS:
             app_logger.warning(f"Ignoring unknown search column: {key}")
+            continue
+        fragment, build_param = _SEARCH_FILTERS[key]
+        where_parts.append(fragment)
+        params.append(build_param(args.get(key)))
 
-    search_str = ("SELECT a.BookId, a.Title, a.Author, a.CopyrightDate, "
-                  "a.IsbnNumber, a.PublisherName, a.CoverType, a.Pages, "
-                  "a.BookNote, a.Recycled, a.Location, a.IsbnNumber13, "
-                  "b.ReadDate "
-                  "FROM books as a LEFT JOIN books_read as b "
-                  "ON a.BookId = b.BookId")
+    search_str = _SEARCH_PREFIX
     if where_parts:
         search_str += " WHERE " + " AND ".join(where_parts)
-    search_str += " ORDER BY a.Author, a.Title ASC"
+    search_str += _SEARCH_SUFFIX
 
     app_logger.debug(search_str)
-    header = table_header + ["ReadDate"]
+    header = books_read_header
+    db = get_db_connection()
     try:
         c = db.cursor()
         try:
@@ -824,7 +927,7 @@ def books_search_utility(args):
             app_logger.error(e)
             error_list = [str(e)]
     finally:
-        db.close()
+        release_db_connection(db)
     return s, header, error_list
 
 
@@ -847,7 +950,7 @@ def book_tags(book_id):
     """
     error_list = None
     s = None
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     search_str = "SELECT a.Label as Tag"
     search_str += " FROM tag_labels a JOIN books_tags b ON a.TagId = b.TagId"
     search_str += " WHERE b.BookId = %s ORDER BY Tag"
@@ -864,7 +967,7 @@ def book_tags(book_id):
             tag_list = [x[0].strip() for x in s]
             rdata = {"BookId": book_id, "tag_list": tag_list}
     finally:
-        db.close()
+        release_db_connection(db)
     return rdata, error_list
 
 
@@ -886,7 +989,27 @@ def get_tag_counts(tag_prefix=None):
         2. header - List of column names ["Tag", "Count"]
         3. error_list - List of error messages or None if successful
     """
-    db = psycopg2.connect(**books_conf)
+    header = ["Tag", "Count"]
+    try:
+        rows = list(_tag_counts(tag_prefix, int(time.time()) // TAG_COUNTS_CACHE_SECONDS))
+    except psycopg2.Error as e:
+        app_logger.error(e)
+        return [], header, [str(e)]
+    return rows, header, None
+
+
+# Lifetime (seconds) of the cached rows behind get_tag_counts; writes made
+# through this process clear them at once, other workers see them within this
+TAG_COUNTS_CACHE_SECONDS = 60
+
+
+@functools.lru_cache(maxsize=256)
+def _tag_counts(tag_prefix, time_bucket):
+    """
+    (Tag, Count) rows for a tag prefix, cached per time bucket.
+
+    Cleared by ``clear_tag_counts``.  Errors are raised, not cached.
+    """
     search_str = "SELECT a.Label as Tag, COUNT(b.TagId) as Count"
     search_str += " FROM tag_labels a JOIN books_tags b ON a.TagId = b.TagId"
     params = ()
@@ -895,19 +1018,18 @@ def get_tag_counts(tag_prefix=None):
         params = (f"{tag_prefix}%",)
     search_str += " GROUP BY Label ORDER BY Count DESC, Label ASC"
     app_logger.debug(search_str)
-    header = ["Tag", "Count"]
-    error_list = None
-    rows = []
-    c = db.cursor()
+    db = get_db_connection()
     try:
-        c.execute(search_str, params)
-        rows = c.fetchall()
-    except psycopg2.Error as e:
-        app_logger.error(e)
-        error_list = [str(e)]
+        with db.cursor() as c:
+            c.execute(search_str, params)
+            return tuple(c.fetchall())
     finally:
-        db.close()
-    return rows, header, error_list
+        release_db_connection(db)
+
+
+def clear_tag_counts():
+    """Drop the cached tag counts after tags, tag labels or tagged books change."""
+    _tag_counts.cache_clear()
 
 
 def add_tag_to_book(book_id, tag):
@@ -929,25 +1051,94 @@ def add_tag_to_book(book_id, tag):
            or an error dictionary on failure.
         2. A list of error messages or None if successful.
     """
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     tag = tag.lower().strip()
     result_data = None
     error_list = None
     try:
         with db.cursor() as c:
             try:
-                c.execute('INSERT INTO tag_labels (Label) VALUES (%s) ON CONFLICT DO NOTHING', (tag,))
-                c.execute('SELECT TagId FROM tag_labels WHERE Label=%s', (tag,))
+                # create the label if missing and link it in one statement; an
+                # existing label is left untouched and its TagId selected instead
+                c.execute('WITH new_label AS ('
+                          ' INSERT INTO tag_labels (Label) VALUES (%s)'
+                          ' ON CONFLICT (Label) DO NOTHING'
+                          ' RETURNING TagId),'
+                          ' label AS ('
+                          ' SELECT TagId FROM new_label'
+                          ' UNION ALL SELECT TagId FROM tag_labels WHERE Label = %s)'
+                          ' INSERT INTO books_tags (BookId, TagId)'
+                          ' SELECT %s, TagId FROM label RETURNING TagId', (tag, tag, book_id))
                 tag_id = c.fetchone()[0]
-                c.execute('INSERT INTO books_tags (BookId, TagId) VALUES (%s, %s)', (book_id, tag_id))
                 result_data = {"BookId": book_id, "Tag": tag, "TagId": tag_id}
             except psycopg2.Error as e:
                 app_logger.error(e)
                 error_list = [str(e)]
                 result_data = {"error": str(e)}
         db.commit()
+        clear_tag_counts()
     finally:
-        db.close()
+        release_db_connection(db)
+    return result_data, error_list
+
+
+def add_tags_to_book(book_id, tags):
+    """
+    Add several tags to a book in one statement.
+
+    Missing tag labels are created; tags the book already has are left as
+    they are.
+
+    Parameters
+    ----------
+    book_id : int
+        The BookId of the book to tag.
+    tags : list of str
+        The tag labels to add (each will be lowercased and trimmed; blank
+        labels are skipped).
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+        1. A list of dictionaries with BookId, Tag, and TagId, one per
+           distinct tag in the order given, on success, or an error
+           dictionary on failure.
+        2. A list of error messages or None if successful.
+    """
+    # one result per distinct tag, in the order given
+    tags = list(dict.fromkeys(tag for tag in (t.lower().strip() for t in tags) if tag))
+    if not tags:
+        return [], None
+    db = get_db_connection()
+    result_data = None
+    error_list = None
+    try:
+        with db.cursor() as c:
+            try:
+                # new labels come from the INSERT, existing ones (left untouched)
+                # from tag_labels; the statement snapshot keeps the two disjoint
+                c.execute('WITH new_labels AS ('
+                          ' INSERT INTO tag_labels (Label) SELECT unnest(%s::VARCHAR[])'
+                          ' ON CONFLICT (Label) DO NOTHING'
+                          ' RETURNING TagId, Label),'
+                          ' labels AS ('
+                          ' SELECT TagId, Label FROM new_labels'
+                          ' UNION ALL SELECT TagId, Label FROM tag_labels WHERE Label = ANY(%s::VARCHAR[])),'
+                          ' links AS ('
+                          ' INSERT INTO books_tags (BookId, TagId) SELECT %s, TagId FROM labels'
+                          ' ON CONFLICT DO NOTHING)'
+                          ' SELECT Label, TagId FROM labels', (tags, tags, book_id))
+                tag_ids = dict(c.fetchall())
+                result_data = [{"BookId": book_id, "Tag": tag, "TagId": tag_ids[tag]} for tag in tags]
+            except psycopg2.Error as e:
+                app_logger.error(e)
+                error_list = [str(e)]
+                result_data = {"error": str(e)}
+        db.commit()
+        clear_tag_counts()
+    finally:
+        release_db_connection(db)
     return result_data, error_list
 
 
@@ -972,7 +1163,7 @@ def get_images_for_book(book_id):
         1. A list of image dictionaries with keys: ImageId, BookId, Name, Url, ImageType
         2. A list of error messages or None if successful
     """
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     search_str = "SELECT ImageId, BookId, Name, Url, ImageType FROM images WHERE BookId = %s"
     images = []
     error_list = None
@@ -981,9 +1172,8 @@ def get_images_for_book(book_id):
         with db.cursor() as c:
             try:
                 c.execute(search_str, (book_id,))
-                results = c.fetchall()
 
-                for row in results:
+                for row in c:
                     images.append({
                         "ImageId": row[0],
                         "BookId": row[1],
@@ -995,7 +1185,7 @@ def get_images_for_book(book_id):
                 app_logger.error(e)
                 error_list = [str(e)]
     finally:
-        db.close()
+        release_db_connection(db)
 
     return images, error_list
 
@@ -1007,7 +1197,7 @@ def get_images_for_book(book_id):
 
 def delete_book(book_id: int) -> dict:
     """Delete a book and all related records (CASCADE handles children)."""
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     result = {}
     try:
         with db.cursor() as c:
@@ -1021,8 +1211,10 @@ def delete_book(book_id: int) -> dict:
                 app_logger.error(e)
                 result = {"error": str(e)}
         db.commit()
+        # the delete cascades to the book's tags
+        clear_tag_counts()
     finally:
-        db.close()
+        release_db_connection(db)
     return result
 
 
@@ -1051,28 +1243,23 @@ def daily_page_record_from_db(record_id):
 
     # Connect to the database
     try:
-        db = psycopg2.connect(**books_conf)
+        db = get_db_connection()
         with db.cursor() as cur:
-            # Execute the query to fetch daily page records
-            q = ("SELECT a.RecordDate, a.Page FROM daily_page_records a "
+            # Execute the query to fetch daily page records, with the day
+            # number (whole days since the first record) computed by the query
+            q = ("SELECT a.RecordDate, a.Page, "
+                 "EXTRACT(DAY FROM a.RecordDate - MIN(a.RecordDate) OVER ())::INT "
+                 "FROM daily_page_records a "
                  "WHERE a.RecordId = %s ORDER BY a.RecordDate ASC")
             app_logger.debug(q)
             cur.execute(q, (record_id,))
-            rows = cur.fetchall()
-
-            # Check if any rows were returned
-            if rows:
-                first_record_date = rows[0][0]
-                for row in rows:
-                    # Calculate the day number and append it to the row
-                    day_number = (row[0] - first_record_date).days
-                    data.append(list(row) + [day_number])
+            data = [list(row) for row in cur]
     except psycopg2.Error as e:
         app_logger.error(f"Database error: {e}")
         error_list = [str(e)]
     finally:
-        # Ensure the database connection is closed
-        db.close()
+        # Return the connection to the pool
+        release_db_connection(db)
 
     return data, error_list
 
@@ -1093,7 +1280,7 @@ def reading_book_data_from_db(record_id):
     error_list = None
     # Establish a database connection
     try:
-        db = psycopg2.connect(**books_conf)
+        db = get_db_connection()
         with db.cursor() as cur:
             # Execute the query to fetch book data
             q = 'SELECT StartDate, LastReadablePage FROM complete_date_estimates WHERE RecordId = %s'
@@ -1105,15 +1292,15 @@ def reading_book_data_from_db(record_id):
         app_logger.error(f"Database error: {e}")
         error_list = [str(e)]
     finally:
-        # Ensure the database connection is closed
-        db.close()
+        # Return the connection to the pool
+        release_db_connection(db)
 
     return rows, error_list
 
 
 def update_reading_book_data(record_id, date_range):
     result = {}
-    db = psycopg2.connect(**books_conf)
+    db = get_db_connection()
     try:
         with db.cursor() as c:
             try:
@@ -1125,7 +1312,7 @@ def update_reading_book_data(record_id, date_range):
                 result = {"error": [str(e)]}
         db.commit()
     finally:
-        db.close()
+        release_db_connection(db)
     return result
 
 
@@ -1142,20 +1329,21 @@ def _estimate_values(x_values, y_values, target_x):
     Returns:
     - list: A list containing the minimum and maximum estimated y-values for the target x-value.
     """
-    slope, _ = np.polyfit(x_values, y_values, 1)  # linear fit to all points
+    # least-squares slope of a linear fit to all points, in closed form
+    x_dev = x_values - x_values.mean()
+    slope = (x_dev * (y_values - y_values.mean())).sum() / (x_dev ** 2).sum()
     most_likely_y = slope * (target_x - np.max(x_values)) + np.max(y_values)
     estimated_range = [float('inf'), -float('inf')]
-    for i in range(len(x_values) - 1):
-        denom = x_values[i + 1] - x_values[i]
-        if denom == 0:
-            app_logger.error(f"Divide by zero error at index {i} -- skipping")
-            app_logger.debug(f"Did you enter the same page count for two different days?")
-            continue
-        else:
-            slope = (y_values[i + 1] - y_values[i]) / denom
-        estimated_y = slope * (target_x - np.max(x_values)) + np.max(y_values)
-        estimated_range[0] = min(estimated_range[0], estimated_y)
-        estimated_range[1] = max(estimated_range[1], estimated_y)
+    # slope of each segment between consecutive points
+    dx = np.diff(x_values)
+    dy = np.diff(y_values)
+    mask = dx != 0
+    if not mask.all():
+        app_logger.error(f"Divide by zero error at index {np.flatnonzero(~mask).tolist()} -- skipping")
+        app_logger.debug(f"Did you enter the same page count for two different days?")
+    if mask.any():
+        estimated_y = dy[mask] / dx[mask] * (target_x - np.max(x_values)) + np.max(y_values)
+        estimated_range = [float(estimated_y.min()), float(estimated_y.max())]
 
     app_logger.debug(f"Estimated days: {most_likely_y} and estimated range: {estimated_range}")
     # expected, shortest, longest in days from first record
@@ -1177,10 +1365,11 @@ def estimate_completion_dates(reading_data, total_pages):
     """
 
     start_date = reading_data[0][0]  # first record date
-    # Convert input data to numpy arrays for manipulation
-    data_array = np.array(reading_data)
-    pages_read = np.array(data_array[:, 1], dtype=np.float64)  # Extract pages read
-    day_number = np.array(data_array[:, 2], dtype=np.float64)  # Extract day numbers
+    # Extract the numeric columns straight into float arrays; converting the
+    # whole record list would first build an object array around the dates
+    n = len(reading_data)
+    pages_read = np.fromiter((r[1] for r in reading_data), dtype=np.float64, count=n)  # Extract pages read
+    day_number = np.fromiter((r[2] for r in reading_data), dtype=np.float64, count=n)  # Extract day numbers
 
     likely_days, min_days, max_days = _estimate_values(pages_read, day_number, total_pages)  # days from first record
     # Calculate the minimum and maximum estimated completion dates
@@ -1312,7 +1501,7 @@ def rag_search(query: str, limit: int = 5) -> list[dict]:
     """
     db = None
     try:
-        db = psycopg2.connect(**books_conf)
+        db = get_db_connection()
         with db.cursor() as c:
             c.execute(sql, (vector_str, vector_str, limit))
             rows = c.fetchall()
@@ -1333,4 +1522,4 @@ def rag_search(query: str, limit: int = 5) -> list[dict]:
         return []
     finally:
         if db:
-            db.close()
+            release_db_connection(db)
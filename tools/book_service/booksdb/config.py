@@ -4,6 +4,7 @@ Configuration module for the books database.
 This module handles loading configuration from JSON files and provides
 shared configuration values used throughout the booksdb package.
 """
+import functools
 import json
 import logging
 import os
@@ -27,6 +28,9 @@ table_header: list[str] = [
     "IsbnNumber13"
 ]
 
+# Columns of the books read by year rows
+books_read_header: list[str] = table_header + ["ReadDate"]
+
 locations_sort_order: list[int] = [3, 4, 2, 1, 7, 6, 5]
 
 FMT: str = "%Y-%m-%d"
@@ -43,6 +47,9 @@ def read_json_configuration() -> tuple[dict[str, Any], dict[str, str]]:
     """
     Retrieve database and ISBN lookup configuration from JSON file.
 
+    The file named by ``BOOKDB_CONFIG`` is read and parsed once; later calls
+    for the same file rebuild fresh dictionaries from the parsed contents.
+
     Returns
     -------
     tuple[dict[str, Any], dict[str, str]]
@@ -56,40 +63,63 @@ def read_json_configuration() -> tuple[dict[str, Any], dict[str, str]]:
     SystemExit
         If a configuration key is missing or the file cannot be read.
     """
-    config_filename = os.getenv("BOOKDB_CONFIG", "./config/configuration.json")
+    c = _load_json_file(os.getenv("BOOKDB_CONFIG", "./config/configuration.json"))
+    try:
+        books_db_config: dict[str, Any] = {
+            "user": c["username"].strip(),
+            "password": c["password"].strip(),
+            "dbname": c["database"].strip(),
+            "host": c["host"].strip(),
+            "port": int(c["port"]),
+            "sslmode": "disable"
+        }
+        isbn_lookup_config: dict[str, str] = {
+            "url_isbn": c["isbn_com"]["url_isbn"].strip(),
+            "key": c["isbn_com"]["key"].strip()
+        }
+        global API_KEY
+        if os.getenv("API_KEY") is not None:
+            API_KEY = os.getenv("API_KEY").replace('\n', '')
+        elif "api_key" in c:
+            API_KEY = c["api_key"].replace('\n', '')
+        else:
+            raise KeyError("Missing API key configuration.")
+        app_logger.debug(f"API key configuration loaded successfully. Using API_KEY={API_KEY}")
+        global EMBED_HOST, EMBED_MODEL, EMBED_API_KEY, EMBED_DIMENSIONS
+        _ai = c.get("ai_agent", {})
+        EMBED_HOST = _ai.get("embed_host")
+        EMBED_MODEL = _ai.get("embed_model")
+        EMBED_API_KEY = _ai.get("embed_api_key")
+        EMBED_DIMENSIONS = int(_ai.get("embed_dimensions", 768))
+    except KeyError as e:
+        app_logger.error(e)
+        raise SystemExit("Missing or incomplete configuration file.")
+    return books_db_config, isbn_lookup_config
+
+
+@functools.lru_cache(maxsize=1)
+def _load_json_file(config_filename: str) -> dict[str, Any]:
+    """
+    Read and parse a JSON configuration file, once per file name.
+
+    Parameters
+    ----------
+    config_filename : str
+        Path of the JSON file to load.
+
+    Returns
+    -------
+    dict[str, Any]
+        The parsed file contents.  The same object is returned on every call
+        for a file, so callers must only read it.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be read.  Errors are not cached.
+    """
     with open(config_filename, "r") as config_file:
-        c = json.load(config_file)
-        try:
-            books_db_config: dict[str, Any] = {
-                "user": c["username"].strip(),
-                "password": c["password"].strip(),
-                "dbname": c["database"].strip(),
-                "host": c["host"].strip(),
-                "port": int(c["port"]),
-                "sslmode": "disable"
-            }
-            isbn_lookup_config: dict[str, str] = {
-                "url_isbn": c["isbn_com"]["url_isbn"].strip(),
-                "key": c["isbn_com"]["key"].strip()
-            }
-            global API_KEY
-            if os.getenv("API_KEY") is not None:
-                API_KEY = os.getenv("API_KEY").replace('\n', '')
-            elif "api_key" in c:
-                API_KEY = c["api_key"].replace('\n', '')
-            else:
-                raise KeyError("Missing API key configuration.")
-            app_logger.debug(f"API key configuration loaded successfully. Using API_KEY={API_KEY}")
-            global EMBED_HOST, EMBED_MODEL, EMBED_API_KEY, EMBED_DIMENSIONS
-            _ai = c.get("ai_agent", {})
-            EMBED_HOST = _ai.get("embed_host")
-            EMBED_MODEL = _ai.get("embed_model")
-            EMBED_API_KEY = _ai.get("embed_api_key")
-            EMBED_DIMENSIONS = int(_ai.get("embed_dimensions", 768))
-        except KeyError as e:
-            app_logger.error(e)
-            raise SystemExit("Missing or incomplete configuration file.")
-        return books_db_config, isbn_lookup_config
+        return json.load(config_file)
 
 
 # Initialize configuration on module load
@@ -0,0 +1,96 @@
+"""
+Connection pool for the books database.
+
+Callers borrow a connection with ``get_db_connection`` and hand it back with
+``release_db_connection`` instead of opening and closing one per request, so
+the connect and authentication handshake is paid once per pooled connection.
+"""
+import os
+import select
+import threading
+
+import psycopg2.pool
+from psycopg2.extensions import connection
+
+from .config import books_conf
+
+# psycopg2 closes, rather than keeps, connections returned beyond the minimum,
+# so the minimum is also how many idle connections each worker keeps open
+POOL_MIN_CONNECTIONS: int = 5
+POOL_MAX_CONNECTIONS: int = 20
+
+_pool: psycopg2.pool.ThreadedConnectionPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """
+    Return this process's connection pool, creating it on first use.
+
+    The pool is created lazily and keyed to the process id, so workers forked
+    by the uWSGI master never share the master's sockets.
+
+    Returns
+    -------
+    psycopg2.pool.ThreadedConnectionPool
+        The pool for the current process.
+    """
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool is None or _pool_pid != pid:
+        with _pool_lock:
+            if _pool is None or _pool_pid != pid:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS, **books_conf)
+                _pool_pid = pid
+    return _pool
+
+
+def get_db_connection() -> connection:
+    """
+    Borrow a connection from the pool.
+
+    Idle pooled connections the server has since closed (restart, idle
+    timeout, pg_terminate_backend) are discarded in favour of a fresh one.
+
+    Returns
+    -------
+    psycopg2.extensions.connection
+        An open database connection; return it with ``release_db_connection``.
+
+    Raises
+    ------
+    psycopg2.Error
+        If a new connection cannot be opened or the pool is exhausted.
+    """
+    pool = _get_pool()
+    db = pool.getconn()
+    if _server_closed(db):
+        pool.putconn(db, close=True)
+        db = pool.getconn()
+    return db
+
+
+def _server_closed(db: connection) -> bool:
+    # An idle connection has nothing to read unless the server has sent its
+    # goodbye, so a readable socket means a dead connection; unlike a
+    # SELECT 1 ping this costs no round trip.
+    if db.closed:
+        return True
+    return bool(select.select([db], [], [], 0)[0])
+
+
+def release_db_connection(db: connection) -> None:
+    """
+    Return a borrowed connection to the pool.
+
+    An open transaction is rolled back by the pool before the connection is
+    reused; a broken connection is discarded.
+
+    Parameters
+    ----------
+    db : psycopg2.extensions.connection
+        A connection obtained from ``get_db_connection``.
+    """
+    _get_pool().putconn(db)
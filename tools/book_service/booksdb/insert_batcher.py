@@ -0,0 +1,129 @@
+"""
+Coalescing of single-row INSERTs for the books database.
+
+Requests that arrive while a flush is running queue up behind it and are
+written together with one multi-row INSERT, so concurrent writers share a
+round trip.  Each caller still waits for, and gets, the result of its own row.
+"""
+import concurrent.futures
+import os
+import queue
+import threading
+from typing import Any
+
+import psycopg2
+import psycopg2.extras
+
+from .config import app_logger
+from .db_pool import get_db_connection, release_db_connection
+
+
+class InsertBatcher:
+    """
+    Batch single-row INSERTs submitted from many threads into one statement.
+
+    Parameters
+    ----------
+    batch_sql : str
+        INSERT with a single ``VALUES %s`` placeholder for execute_values.
+    row_sql : str
+        The same INSERT for one row, used to retry rows of a failed batch.
+    max_batch : int, optional
+        Most rows written by one statement (default: 200).
+    """
+
+    def __init__(self, batch_sql: str, row_sql: str, max_batch: int = 200):
+        self.batch_sql = batch_sql
+        self.row_sql = row_sql
+        self.max_batch = max_batch
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker_pid: int | None = None
+
+    def submit(self, params: tuple[Any, ...]) -> concurrent.futures.Future:
+        """
+        Queue one row for insertion.
+
+        Parameters
+        ----------
+        params : tuple
+            Column values in the order of the INSERT's column list.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to None once the row is committed, or raises the
+            psycopg2.Error that rejected it.
+        """
+        self._ensure_worker()
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._queue.put((params, future))
+        return future
+
+    def _ensure_worker(self) -> None:
+        # one flushing thread per process; uWSGI workers are forked after import
+        pid = os.getpid()
+        if self._worker_pid != pid:
+            with self._lock:
+                if self._worker_pid != pid:
+                    self._queue = queue.Queue()
+                    threading.Thread(target=self._run, daemon=True).start()
+                    self._worker_pid = pid
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            # take whatever queued up meanwhile; never wait for more, so a lone
+            # request is written at once
+            while len(items) < self.max_batch:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._flush(items)
+            except Exception as e:
+                # keep the worker alive and never leave a caller waiting
+                app_logger.error(e)
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _flush(self, items: list[tuple[tuple[Any, ...], concurrent.futures.Future]]) -> None:
+        try:
+            db = get_db_connection()
+        except psycopg2.Error as e:
+            app_logger.error(e)
+            for _, future in items:
+                future.set_exception(e)
+            return
+        try:
+            try:
+                with db.cursor() as c:
+                    psycopg2.extras.execute_values(c, self.batch_sql, [params for params, _ in items])
+                db.commit()
+            except psycopg2.Error as e:
+                db.rollback()
+                if len(items) == 1:
+                    items[0][1].set_exception(e)
+                    return
+                # one bad row fails the whole statement; retry row by row so
+                # every caller gets its own outcome
+                app_logger.debug(f"batch of {len(items)} rows failed, retrying individually: {e}")
+                self._flush_rows(db, items)
+                return
+        finally:
+            release_db_connection(db)
+        for _, future in items:
+            future.set_result(None)
+
+    def _flush_rows(self, db, items: list[tuple[tuple[Any, ...], concurrent.futures.Future]]) -> None:
+        for params, future in items:
+            try:
+                with db.cursor() as c:
+                    c.execute(self.row_sql, params)
+                db.commit()
+                future.set_result(None)
+            except psycopg2.Error as e:
+                db.rollback()
+                future.set_exception(e)
@@ -2,9 +2,11 @@
 Serialization utilities for converting database results to JSON.
 """
 import datetime
-import json
 from decimal import Decimal
-from typing import Any
+from operator import itemgetter
+from typing import Any, Callable
+
+import orjson
 
 from .config import app_logger
 
@@ -31,17 +33,20 @@ def sort_list_by_index_list(
     list[Any]
         A list of values from `lst` sorted according to `indexes`.
     """
-    return [val for (_, val) in sorted(zip(indexes, lst), key=lambda x: x[0], reverse=reverse)]
+    return [val for (_, val) in sorted(zip(indexes, lst), key=itemgetter(0), reverse=reverse)]
 
 
 def serialized_result_dict(
     db_result_rows: list[tuple[Any, ...]] | None,
     header: list[str] | None = None,
     error_list: list[str] | None = None
-) -> str:
+) -> bytes:
     """
     Serializes database result rows into JSON.
 
+    Rows stay as positional lists alongside one header list rather than being
+    expanded into per-row dicts, and orjson encodes them straight to bytes.
+
     Arguments
     ---------
     db_result_rows : list[tuple[Any, ...]] | None
@@ -53,14 +58,47 @@ def serialized_result_dict(
 
     Returns
     -------
-    str
-        A JSON formatted string representing the serialized result set.
+    bytes
+        UTF-8 encoded JSON representing the serialized result set.
     """
     result = _create_serializeable_result_dict(db_result_rows, header, error_list=None)
-    result_dict_json = json.dumps(result)
+    result_dict_json = orjson.dumps(result)
     return result_dict_json
 
 
+# date.isoformat writes the "%Y-%m-%d" string without interpreting a format,
+# and called through the date class formats only the date part of a datetime
+_format_date: Callable[[datetime.date], str] = datetime.date.isoformat
+
+
+# Converter for each value type seen in database rows, looked up by exact type;
+# None marks types passed through unchanged.  Other types are resolved once by
+# _resolve_converter and added here.
+_CONVERTERS: dict[type, Callable[[Any], Any] | None] = {
+    Decimal: float,
+    datetime.datetime: _format_date,
+    datetime.date: _format_date,
+    int: None,
+    float: None,
+    str: None,
+    bool: None,
+    type(None): None,
+}
+_UNSEEN = object()
+
+
+def _resolve_converter(value_type: type) -> Callable[[Any], Any] | None:
+    # subclasses convert like their base class
+    if issubclass(value_type, Decimal):
+        converter = float
+    elif issubclass(value_type, datetime.date):
+        converter = _format_date
+    else:
+        converter = None
+    _CONVERTERS[value_type] = converter
+    return converter
+
+
 def _convert_db_types(value_list: list[Any] | tuple[Any, ...]) -> list[Any]:
     """
     Converts database row values to JSON-serializable types.
@@ -71,14 +109,13 @@ def _convert_db_types(value_list: list[Any] | tuple[Any, ...]) -> list[Any]:
     Returns:
         A new list with Decimal converted to float, dates formatted as strings.
     """
+    get_converter = _CONVERTERS.get
     new_value_list: list[Any] = []
     for d in value_list:
-        if isinstance(d, Decimal):
-            new_value_list.append(float(d))
-        elif isinstance(d, datetime.datetime) or isinstance(d, datetime.date):
-            new_value_list.append(d.strftime("%Y-%m-%d"))
-        else:
-            new_value_list.append(d)
+        converter = get_converter(type(d), _UNSEEN)
+        if converter is _UNSEEN:
+            converter = _resolve_converter(type(d))
+        new_value_list.append(d if converter is None else converter(d))
     return new_value_list
 
 
@@ -112,10 +149,9 @@ def _create_serializeable_result_dict(
     if db_result is None or len(db_result) == 0:
         pass
     elif isinstance(db_result[0], tuple) or isinstance(db_result[0], list):
-        for row in db_result:
-            if header and len(header) != len(row):
-                app_logger.debug("mismatched header to data provided")
-            result_rows.append(_convert_db_types(row))
+        if header and any(len(row) != len(header) for row in db_result):
+            app_logger.debug("mismatched header to data provided")
+        result_rows = [_convert_db_types(row) for row in db_result]
     else:
         result_rows = _convert_db_types(db_result)  # type: ignore[assignment]
     result_dict["data"] = result_rows
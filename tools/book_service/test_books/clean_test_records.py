@@ -12,14 +12,16 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 import psycopg2
 from booksdb.config import books_conf
 
+# (label, statement, parameters); one statement per table
 CLEANUP_QUERIES = [
-    ("tag_labels (deleteme)", "DELETE FROM tag_labels WHERE label = 'deleteme'"),
-    ("tag_labels (delete_me)", "DELETE FROM tag_labels WHERE label = 'delete_me'"),
-    ("images (test_%)", "DELETE FROM images WHERE Name LIKE 'test_%'"),
-    ("images (custom_test%)", "DELETE FROM images WHERE Name LIKE 'custom_test%'"),
-    ("books (Printerman)", "DELETE FROM books WHERE PublisherName = 'Printerman'"),
-    ("books_read (1945-10-19)", "DELETE FROM books_read WHERE ReadDate = '1945-10-19'"),
-    ("complete_date_estimates (15000)", "DELETE FROM complete_date_estimates WHERE LastReadablePage = 15000"),
+    ("tag_labels (deleteme, delete_me)", "DELETE FROM tag_labels WHERE label IN (%s, %s)",
+     ("deleteme", "delete_me")),
+    ("images (test_%, custom_test%)", "DELETE FROM images WHERE Name LIKE %s OR Name LIKE %s",
+     ("test_%", "custom_test%")),
+    ("books (Printerman)", "DELETE FROM books WHERE PublisherName = %s", ("Printerman",)),
+    ("books_read (1945-10-19)", "DELETE FROM books_read WHERE ReadDate = %s", ("1945-10-19",)),
+    ("complete_date_estimates (15000)", "DELETE FROM complete_date_estimates WHERE LastReadablePage = %s",
+     (15000,)),
 ]
 
 
@@ -28,8 +30,8 @@ def main() -> None:
     try:
         with conn.cursor() as cursor:
             total = 0
-            for label, sql in CLEANUP_QUERIES:
-                cursor.execute(sql)
+            for label, sql, params in CLEANUP_QUERIES:
+                cursor.execute(sql, params)
                 count = cursor.rowcount
                 total += count
                 if count > 0:
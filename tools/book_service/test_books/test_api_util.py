@@ -38,7 +38,7 @@ class TestAppUtilityFunctions(unittest.TestCase):
         cursor = [(Decimal(1), 'Title1', 'Author1', datetime.date(2022, 1, 1)),
                   (Decimal(2), 'Title2', 'Author2', datetime.date(2022, 1, 2))]
         header = ['ID', 'Title', 'Author', 'Date']
-        expected_result = '{"header": ["ID", "Title", "Author", "Date"], "data": [[1.0, "Title1", "Author1", "2022-01-01"], [2.0, "Title2", "Author2", "2022-01-02"]]}'
+        expected_result = b'{"header":["ID","Title","Author","Date"],"data":[[1.0,"Title1","Author1","2022-01-01"],[2.0,"Title2","Author2","2022-01-02"]]}'
         result = au.serialized_result_dict(cursor, header)
         self.assertEqual(result, expected_result)
 
@@ -46,10 +46,10 @@ class TestAppUtilityFunctions(unittest.TestCase):
         rdata = '{"header": ["ID", "Title", "Author", "Date"], "data": [[1, "Title1", "Author1", "2022-01-01"], [2, "Title2", "Author2", "2022-01-02"]]}'
         response_header = resp_header(rdata)
         print(response_header)
-        expected_header = [
+        expected_header = (
             ('Content-type', 'application/json; charset=utf-8'),
             ('Content-Length', str(len(rdata)))
-        ]
+        )
         self.assertEqual(response_header, expected_header)
 
     def test_summary_books_read_by_year(self):
@@ -67,6 +67,21 @@ class TestAppUtilityFunctions(unittest.TestCase):
         self.assertEqual(str(res[0])[:64],
                          """(155, 'Letters To Children', 'Lewis, C S', datetime.datetime(198""")
 
+    def test_iter_books_read(self):
+        res, _, header, error = au.books_read_by_year_utility(target_year=1966)
+        rows = list(au.iter_books_read_by_year(target_year=1966, chunk_size=5))
+        self.assertEqual(rows, res)
+        self.assertEqual(header, au.books_read_header)
+
+    def test_year_progress(self):
+        res, header, error = au.year_progress_utility()
+        self.assertIsNone(error)
+        self.assertEqual(header, ["Pages", "Day", "Year"])
+        res_1966 = [r for r in res if r[2] == 1966]
+        self.assertEqual(len(res_1966), 13)
+        # running total ends at the year's summary page count
+        self.assertEqual(res_1966[-1][0], 2527)
+
     def test_tags_search(self):
         res, header, error = au.tags_search_utility("science")
         self.assertGreater(len(res), 0)  # Should find books with 'science' tag
@@ -159,6 +159,18 @@ class TestAppFunctions(unittest.TestCase):
             print(res.json())
             self.assertTrue(res.status_code == 200)
 
+    def test_add_tags_list(self):
+        book_id = self.book_id_list[0]
+        ep = ENDPOINT + f"/add_tags/{book_id}"
+        print(f"QUERY={ep}")
+        res = requests.put(ep, json=["DeleteMe ", "delete_me", "  "], headers={'x-api-key': f'{au.API_KEY}'})
+        print(res.json())
+        self.assertTrue(res.status_code == 200)
+        self.assertEqual([x["Tag"] for x in res.json()["data"]], ["deleteme", "delete_me"])
+        for bad_payload in ["deleteme", {"deleteme": 1}, [], ["deleteme", 3]]:
+            res = requests.put(ep, json=bad_payload, headers={'x-api-key': f'{au.API_KEY}'})
+            self.assertTrue(res.status_code == 400)
+
     def test_tags(self):
         id = 2
         ep = ENDPOINT + f"/tags/{id}"
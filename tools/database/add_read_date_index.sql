@@ -0,0 +1,10 @@
+-- ReadDate index for per-year reading reports
+-- Run against the book-collection database:
+--   psql -U scott -h 192.168.1.90 -p 5434 -d book-collection < add_read_date_index.sql
+--
+-- The per-year report queries filter books_read on a ReadDate range.  The
+-- primary key leads with BookId, so without this index the range is a full
+-- scan; BookId is included so the join to books reads the index alone.
+
+CREATE INDEX IF NOT EXISTS idx_books_read_date
+    ON books_read (ReadDate, BookId);
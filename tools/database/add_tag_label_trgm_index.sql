@@ -0,0 +1,12 @@
+-- Trigram index for tag label substring searches
+-- Run against the book-collection database:
+--   psql -U scott -h 192.168.1.90 -p 5434 -d book-collection < add_tag_label_trgm_index.sql
+--
+-- /tags/<match> and the books_search Tags filter match tag labels with
+-- LIKE '%match%'.  A leading wildcard cannot use a btree index, but a
+-- pg_trgm GIN index serves the same LIKE without changing its semantics.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_tag_labels_label_trgm
+    ON tag_labels USING gin (Label gin_trgm_ops);
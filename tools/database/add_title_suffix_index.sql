@@ -0,0 +1,10 @@
+-- Reversed-title index for trailing-article lookups
+-- Run against the book-collection database:
+--   psql -U scott -h 192.168.1.90 -p 5434 -d book-collection < add_title_suffix_index.sql
+--
+-- bin/fix_article_titles.py looks for titles ending in ", The", ", An" or ", A".
+-- A suffix LIKE cannot use idx_books_title, but the same match written as a
+-- prefix on reverse(Title) can use this index as a range scan.
+
+CREATE INDEX IF NOT EXISTS idx_books_title_rev
+    ON books (reverse(Title) text_pattern_ops);
@@ -52,6 +52,11 @@ CREATE INDEX IF NOT EXISTS idx_books_title    ON books (Title);
 CREATE INDEX IF NOT EXISTS idx_books_author   ON books (Author);
 CREATE INDEX IF NOT EXISTS idx_books_location ON books (Location);
 
+-- Reversed-title index: turns suffix matches (Title LIKE '%, The') into
+-- prefix matches on reverse(Title) so bin/fix_article_titles.py can range-scan
+CREATE INDEX IF NOT EXISTS idx_books_title_rev
+    ON books (reverse(Title) text_pattern_ops);
+
 DROP TRIGGER IF EXISTS trg_books_update ON books;
 CREATE TRIGGER trg_books_update
     BEFORE UPDATE ON books
@@ -79,6 +84,10 @@ CREATE TABLE IF NOT EXISTS books_read (
         REFERENCES books (BookId) ON DELETE CASCADE ON UPDATE CASCADE
 );
 
+-- ReadDate range scans for the per-year reading reports
+CREATE INDEX IF NOT EXISTS idx_books_read_date
+    ON books_read (ReadDate, BookId);
+
 DROP TRIGGER IF EXISTS trg_books_read_update ON books_read;
 CREATE TRIGGER trg_books_read_update
     BEFORE UPDATE ON books_read